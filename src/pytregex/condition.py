@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 
 import re
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generator, Iterable, Iterator, List, NamedTuple, Optional
+from functools import lru_cache, partial
+from itertools import chain as _chain
+from itertools import compress, repeat
+from math import prod
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Generator, Iterable, Iterator, List, Optional
 
 from .exceptions import ParseException
 
@@ -13,6 +21,8 @@ if TYPE_CHECKING:
 
 
 class NamedNodes:
+    __slots__ = ("name", "nodes", "string_repr")
+
     def __init__(self, name: Optional[str], nodes: Optional[List["Tree"]], string_repr: str = "") -> None:
         self.name = name
         self.nodes = nodes
@@ -25,21 +35,50 @@ class NamedNodes:
         self.nodes = new_nodes
 
 
-class NodeDescription(NamedTuple):
-    op: type["NODE_OP"]
-    value: str
+class NodeDescription:
+    __slots__ = ("op", "value", "under_negation", "use_basic_cat")
+
+    def __init__(
+        self,
+        op: type["NODE_OP"],
+        value: str,
+        under_negation: bool = False,
+        use_basic_cat: bool = False,
+    ) -> None:
+        self.op = op
+        # labels are interned by Tree.set_label as well, see NODE_ID
+        self.value = sys.intern(value)
+        self.under_negation = under_negation
+        self.use_basic_cat = use_basic_cat
 
     def __repr__(self) -> str:
         return self.value
 
+    def with_flags(self, under_negation: bool, use_basic_cat: bool) -> "NodeDescription":
+        if under_negation == self.under_negation and use_basic_cat == self.use_basic_cat:
+            return self
+        return NodeDescription(self.op, self.value, under_negation, use_basic_cat)
 
-@dataclass
+
+@dataclass(slots=True)
 class BackRef:
     node_descriptions: "NodeDescriptions"
     nodes: Optional[list["Tree"]]
 
 
 class NodeDescriptions:
+    __slots__ = (
+        "descriptions",
+        "under_negation",
+        "use_basic_cat",
+        "condition",
+        "backref",
+        "name",
+        "_match",
+        "_match_label",
+        "_match_const",
+    )
+
     def __init__(
         self,
         *node_descriptions: NodeDescription,
@@ -57,6 +96,8 @@ class NodeDescriptions:
         self.backref = backref
         self.name = name
 
+        self._build_preds()
+
     def __iter__(self) -> Iterator[NodeDescription]:
         return iter(self.descriptions)
 
@@ -71,6 +112,16 @@ class NodeDescriptions:
             ret = f"({ret} {self.condition})"
         return ret
 
+    def structure(self) -> tuple:
+        """what tells node descriptions apart, see AbstractCondition.structure"""
+        return (
+            tuple((desc.op, desc.value) for desc in self.descriptions),
+            self.under_negation,
+            self.use_basic_cat,
+            self.name,
+            None if self.condition is None else self.condition.structure(),
+        )
+
     def set_backref(
         self,
         backref: BackRef,
@@ -83,16 +134,33 @@ class NodeDescriptions:
         if self.condition is None:
             self.condition = And(condition)
         else:
-            self.condition.append_condition(condition)
+            self.condition._unchecked_append(condition)
+
+    def finalize(self) -> None:
+        """
+        Check the names declared in the condition, once the whole pattern has
+        been parsed.
+        """
+        if self.condition is None:
+            return
+
+        self.condition.finalize()
+        # complains about duplicate names in conjunction
+        if self.name is not None and self.name in self.condition.names:
+            raise ParseException(
+                f"Variable '{self.name}' was declared twice in the scope of the same conjunction."
+            )
 
     def add_description(self, other_description: NodeDescription) -> None:
         self.descriptions.append(other_description)
+        self._build_preds()
 
     def negate(self) -> bool:
         if self.under_negation:
             return False
 
         self.under_negation = True
+        self._build_preds()
         return True
 
     def enable_basic_cat(self) -> bool:
@@ -100,59 +168,149 @@ class NodeDescriptions:
             return False
 
         self.use_basic_cat = True
+        self._build_preds()
         return True
 
+    def _build_preds(self) -> None:
+        """
+        Build the matchers of the descriptions, with their ops, values and the
+        negation/basic-category flags bound, so that matching a node does not
+        need to look them up again: `_match` for nodes, `_match_label` for
+        plain labels and `_match_const` for "__". Must be called whenever any
+        of them changes.
+        """
+        # descriptions might be shared with another NodeDescriptions through
+        # `~name`, so rebind by copying instead of modifying them in place
+        under_negation, use_basic_cat = self.under_negation, self.use_basic_cat
+        self.descriptions = [desc.with_flags(under_negation, use_basic_cat) for desc in self.descriptions]
+
+        # values of the same op are checked together, see NODE_OP.make_value_test
+        values_by_op: dict[type[NODE_OP], list[str]] = {}
+        for desc in self.descriptions:
+            values_by_op.setdefault(desc.op, []).append(desc.value)
+
+        # ids next to regexes, e.g., "NP|/^V/", join the regex alternation as
+        # anchored literals, so that a node is checked by one search instead
+        # of a lookup and a search
+        if not under_negation and NODE_ID in values_by_op and NODE_REGEX in values_by_op:
+            regexes = [*values_by_op[NODE_REGEX], *(f"/\\A{re.escape(id)}\\Z/" for id in values_by_op[NODE_ID])]
+            if NODE_REGEX.make_value_test(tuple(regexes)) is not None:
+                del values_by_op[NODE_ID]
+                values_by_op[NODE_REGEX] = regexes
+
+        preds = [
+            op.make_in_checker(values, under_negation=under_negation, use_basic_cat=use_basic_cat)
+            for op, values in values_by_op.items()
+        ]
+        if len(preds) == 1:
+            self._match = preds[0]
+        else:
+            self._match = _match_any(tuple(preds))
+
+        # the same test on plain labels, for searches to map over
+        # Tree.preorder_labels. that has "" for missing labels, which must
+        # fail as a missing label does without negation
+        match_label = None
+        if len(values_by_op) == 1 and not under_negation and not use_basic_cat:
+            ((op, values),) = values_by_op.items()
+            match_label = op.make_value_test(tuple(values))
+            if match_label is not None and match_label("") is not None:
+                match_label = None
+        self._match_label = match_label
+
+        # "__" matches every node, or none under negation, whatever its label.
+        # searches can then skip the test altogether
+        self._match_const: Optional[bool] = None
+        if all(desc.op is NODE_ANY for desc in self.descriptions):
+            self._match_const = not under_negation
+
+    @property
+    def match(self) -> Callable[["Tree"], bool]:
+        """
+        Whether a node fits the descriptions, ignoring the condition. A plain
+        one-argument function, for relations to filter candidates with.
+        """
+        return self._match
+
+    @property
+    def match_const(self) -> Optional[bool]:
+        """
+        True if the descriptions match every node and False if none, e.g., "__"
+        and "!__", whatever the label; None if it depends on the node.
+        """
+        return self._match_const
+
     def _satisfies_ignore_condition(self, t: "Tree"):
-        return any(
-            desc.op.satisfies(
-                t, desc.value, under_negation=self.under_negation, use_basic_cat=self.use_basic_cat
-            )
-            for desc in self.descriptions
-        )
+        return self._match(t)
 
     def satisfies(self, t: "Tree") -> bool:
         if self.condition is None:
-            return any(
-                desc.op.satisfies(
-                    t, desc.value, under_negation=self.under_negation, use_basic_cat=self.use_basic_cat
-                )
-                for desc in self.descriptions
-            )
+            return self._satisfies_ignore_condition(t)
         else:
-            cond_satisfies = self.condition.satisfies
-            return any(
-                desc.op.satisfies(
-                    t, desc.value, under_negation=self.under_negation, use_basic_cat=self.use_basic_cat
-                )
-                and cond_satisfies(t)
-                for desc in self.descriptions
-            )
+            return self._satisfies_ignore_condition(t) and self.condition.satisfies(t)
+
+    def searchNodeIterator(self, t: "Tree", *, recursive: bool = True) -> Iterator["Tree"]:
+        node_gen: Iterable["Tree"]
+        if not recursive:
+            node_gen = (t,) if self._match(t) else ()
+        elif (match_const := self._match_const) is not None:
+            node_gen = t.preorder_list() if match_const else ()
+        elif (match_label := self._match_label) is not None:
+            node_gen = compress(t.preorder_list(), map(match_label, t.preorder_labels()))
+        elif self.condition is None:
+            # nothing to search under the matched nodes, collect them in one go
+            node_gen = t.preorder_collect(self._match)
+        else:
+            node_gen = filter(self._match, t.preorder_list())
 
-    def searchNodeIterator(self, t: "Tree", *, recursive: bool = True) -> Generator["Tree", None, None]:
-        node_gen = t.preorder_iter() if recursive else (t for _ in range(1))
-        node_gen = filter(self._satisfies_ignore_condition, node_gen)
+        if self.condition is None and self.backref is None:
+            # the matched nodes are the result, hand them out directly instead
+            # of re-yielding them from a generator
+            return iter(node_gen)
+        return self._search_matched(node_gen)
 
-        if self.condition is None:
-            ret = node_gen
+    def _search_matched(self, node_gen: Iterable["Tree"]) -> Generator["Tree", None, None]:
+        """the part of searchNodeIterator for a condition or a name"""
+        cond_search = None
+        if self.condition is not None:
+            cond_search = self.condition.searchNodeIterator
+
+        if self.backref is None:
+            assert cond_search is not None
+            for node in node_gen:
+                yield from cond_search(node)
+            return
+
+        # named nodes are collected in full before yielding any of them
+        ret: list["Tree"]
+        if cond_search is None:
+            ret = list(node_gen)
         else:
-            # complains about duplicate names in conjunction
-            if self.name is not None and self.name in self.condition.names:
-                raise ParseException(
-                    f"Variable '{self.name}' was declared twice in the scope of the same conjunction."
-                )
+            ret = [match for node in node_gen for match in cond_search(node)]
 
-            cond_search = self.condition.searchNodeIterator
-            ret = (m for node in node_gen for m in cond_search(node))
-
-        if self.backref is not None:
-            ret = list(ret)
-            if self.backref.nodes is not None:
-                self.backref.nodes.extend(ret)
-            else:
-                self.backref.nodes = ret
+        if self.backref.nodes is not None:
+            self.backref.nodes.extend(ret)
+        else:
+            self.backref.nodes = ret
         yield from ret
 
 
+def _match_any(checks: tuple[Callable[["Tree"], bool], ...]) -> Callable[["Tree"], bool]:
+    """
+    Combine `checks` into one that passes if any of them does. A plain loop
+    rather than any() over a generator, which would set up a generator frame
+    per node.
+    """
+
+    def match(node: "Tree") -> bool:
+        for check in checks:  # noqa: SIM110 - any() would cost a generator frame per node
+            if check(node):
+                return True
+        return False
+
+    return match
+
+
 class NODE_OP(ABC):
     @classmethod
     @abstractmethod
@@ -176,9 +334,67 @@ class NODE_OP(ABC):
         use_basic_cat: bool = False,
     ) -> bool:
         return any(
-            cls.satisfies(node, id, under_negation=under_negation, use_basic_cat=use_basic_cat) for id in ids
+            map(partial(cls.satisfies, node, under_negation=under_negation, use_basic_cat=use_basic_cat), ids)
         )
 
+    @classmethod
+    def make_checker(
+        cls,
+        value: str = "",
+        *,
+        under_negation: bool = False,
+        use_basic_cat: bool = False,
+    ) -> Callable[["Tree"], bool]:
+        """
+        Return a one-argument equivalent of `satisfies` with value and flags
+        fixed, so that subclasses can resolve as much as possible up front.
+        """
+        satisfies = cls.satisfies
+        return lambda node: satisfies(node, value, under_negation=under_negation, use_basic_cat=use_basic_cat)
+
+    @classmethod
+    def make_in_checker(
+        cls,
+        values: Iterable[str],
+        *,
+        under_negation: bool = False,
+        use_basic_cat: bool = False,
+    ) -> Callable[["Tree"], bool]:
+        """
+        Return a one-argument equivalent of `in_` with values and flags fixed.
+        Without negation, the values are checked by a single test if
+        `make_value_test` can fuse them.
+        """
+        values = tuple(values)
+        if len(values) == 1:
+            return cls.make_checker(values[0], under_negation=under_negation, use_basic_cat=use_basic_cat)
+
+        if not under_negation and (test := cls.make_value_test(values)) is not None:
+            get_value = attrgetter("basic_category" if use_basic_cat else "label")
+
+            def checker(node: "Tree") -> bool:
+                value = get_value(node)
+                return value is not None and test(value) is not None
+
+            return checker
+
+        checkers = tuple(
+            cls.make_checker(value, under_negation=under_negation, use_basic_cat=use_basic_cat)
+            for value in values
+        )
+        return _match_any(checkers)
+
+    @classmethod
+    def make_value_test(cls, values: tuple[str, ...]) -> Optional[Callable[[str], object]]:
+        """
+        Fuse `values` into a single C-level test of a label (or basic
+        category): it returns None iff `in_` fails for a node with that label,
+        without negation, and something truthy otherwise. None if the op does
+        not look at labels or the values can't be fused. This is where the
+        values of a disjunction are combined, for nodes and plain labels alike.
+        """
+        return None
+
 
 class NODE_ID(NODE_OP):
     @classmethod
@@ -193,6 +409,62 @@ class NODE_ID(NODE_OP):
         else:
             return (value == id) != under_negation
 
+    @classmethod
+    def in_(
+        cls, node: "Tree", ids: Iterable[str], *, under_negation: bool = False, use_basic_cat: bool = False
+    ) -> bool:
+        value = node.basic_category if use_basic_cat else node.label
+
+        if value is None:
+            return under_negation
+        elif under_negation:
+            # negation applies to each id separately
+            for id in ids:  # noqa: SIM110 - any() would cost a generator frame per node
+                if value != id:
+                    return True
+            return False
+        else:
+            return value in ids
+
+    @classmethod
+    def make_checker(
+        cls, id: str, *, under_negation: bool = False, use_basic_cat: bool = False
+    ) -> Callable[["Tree"], bool]:
+        get_value = attrgetter("basic_category" if use_basic_cat else "label")
+
+        def checker(node: "Tree") -> bool:
+            value = get_value(node)
+            if value is None:
+                return under_negation
+            return (value == id) != under_negation
+
+        return checker
+
+    @classmethod
+    def make_in_checker(
+        cls, values: Iterable[str], *, under_negation: bool = False, use_basic_cat: bool = False
+    ) -> Callable[["Tree"], bool]:
+        if not under_negation:
+            return super().make_in_checker(values, use_basic_cat=use_basic_cat)
+
+        # negation applies to each id separately, so a value passes if it
+        # differs from any of the ids. with several distinct ids every value
+        # does, with a single id it is a plain inequality.
+        get_value = attrgetter("basic_category" if use_basic_cat else "label")
+        ids = frozenset(values)
+        several_ids = len(ids) > 1
+
+        def negated_checker(node: "Tree") -> bool:
+            value = get_value(node)
+            return value is None or several_ids or value not in ids
+
+        return negated_checker
+
+    @classmethod
+    def make_value_test(cls, values: tuple[str, ...]) -> Optional[Callable[[str], object]]:
+        # maps each id to itself, which is truthy as ids are never empty
+        return {id: id for id in values}.get
+
 
 class NODE_REGEX(NODE_OP):
     @classmethod
@@ -205,28 +477,88 @@ class NODE_REGEX(NODE_OP):
         if value is None:
             return under_negation
         else:
-            # Convert regex to standard python regex
-            flag = ""
-            current_flag = regex[-1]
-            while current_flag != "/":
-                # Seems that only (?m) and (?x) are useful for node describing:
-                #  re.ASCII      (?a)
-                #  re.IGNORECASE (?i)
-                #  re.LOCALE     (?L)
-                #  re.DOTALL     (?s)
-                #  re.MULTILINE  (?m)
-                #  re.VERBOSE    (?x)
-                if current_flag not in "xi":
-                    raise ValueError(f"Error!! Unsupported regexp flag: {current_flag}")
-                flag += current_flag
-                regex = regex[:-1]
-                current_flag = regex[-1]
-
-            regex = regex[1:-1]
-            if flag:
-                regex = "(?" + "".join(set(flag)) + ")" + regex
-
-            return (re.search(regex, value) is not None) != under_negation
+            return (_compile_regex(regex).search(value) is not None) != under_negation
+
+    @classmethod
+    def in_(
+        cls, node: "Tree", regexes: Iterable[str], *, under_negation: bool = False, use_basic_cat: bool = False
+    ) -> bool:
+        regexes = tuple(regexes)
+        if under_negation or (test := cls.make_value_test(regexes)) is None:
+            return super().in_(node, regexes, under_negation=under_negation, use_basic_cat=use_basic_cat)
+
+        value = node.basic_category if use_basic_cat else node.label
+        return value is not None and test(value) is not None
+
+    @classmethod
+    def make_checker(
+        cls, regex: str, *, under_negation: bool = False, use_basic_cat: bool = False
+    ) -> Callable[["Tree"], bool]:
+        get_value = attrgetter("basic_category" if use_basic_cat else "label")
+        search = _compile_regex(regex).search
+
+        def checker(node: "Tree") -> bool:
+            value = get_value(node)
+            if value is None:
+                return under_negation
+            return (search(value) is not None) != under_negation
+
+        return checker
+
+    @classmethod
+    def make_value_test(cls, values: tuple[str, ...]) -> Optional[Callable[[str], object]]:
+        if len(values) == 1:
+            return _compile_regex(values[0]).search
+        if (fused := _fuse_regexes(values)) is not None:
+            return fused.search
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _compile_regex(regex: str) -> re.Pattern:
+    """
+    Convert a tregex-style "/regex/flags" string into a compiled python regex.
+    The result is cached, so that the flag parsing and compiling happen once per
+    pattern rather than once per visited node.
+    """
+    body, _, flag_chars = regex[1:].rpartition("/")
+    flags = 0
+    for flag in flag_chars:
+        try:
+            flags |= _REGEX_FLAGS[flag]
+        except KeyError:
+            raise ValueError(f"Error!! Unsupported regexp flag: {flag}") from None
+    return re.compile(body, flags)
+
+
+# Seems that only (?m) and (?x) are useful for node describing:
+#  re.ASCII      (?a)
+#  re.IGNORECASE (?i)
+#  re.LOCALE     (?L)
+#  re.DOTALL     (?s)
+#  re.MULTILINE  (?m)
+#  re.VERBOSE    (?x)
+_REGEX_FLAGS = {"i": re.IGNORECASE, "x": re.VERBOSE}
+
+
+@lru_cache(maxsize=4096)
+def _fuse_regexes(regexes: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Combine tregex-style "/regex/flags" strings into one alternation that
+    searches successfully iff any of them does. Return None for the ones that
+    can't be combined safely: capturing groups would be renumbered and
+    verbose-mode comments would swallow the rest of the alternation.
+    """
+    branches = []
+    for regex in regexes:
+        pattern = _compile_regex(regex)
+        if pattern.groups or pattern.flags & re.VERBOSE:
+            return None
+        branches.append(f"(?{'i' if pattern.flags & re.IGNORECASE else ''}:{pattern.pattern})")
+    try:
+        return re.compile("|".join(branches))
+    except re.error:
+        return None
 
 
 class NODE_ANY(NODE_OP):
@@ -241,6 +573,17 @@ class NODE_ANY(NODE_OP):
     ) -> bool:
         return not under_negation
 
+    @classmethod
+    def make_checker(
+        cls,
+        value: str = "",
+        *,
+        under_negation: bool = False,
+        use_basic_cat: bool = False,
+    ) -> Callable[["Tree"], bool]:
+        ret = not under_negation
+        return lambda node: ret
+
 
 class NODE_ROOT(NODE_OP):
     @classmethod
@@ -254,25 +597,130 @@ class NODE_ROOT(NODE_OP):
     ) -> bool:
         return (node.parent is None) != under_negation
 
+    @classmethod
+    def make_checker(
+        cls,
+        value: str = "",
+        *,
+        under_negation: bool = False,
+        use_basic_cat: bool = False,
+    ) -> Callable[["Tree"], bool]:
+        if under_negation:
+            return lambda node: node.parent is not None
+        return lambda node: node.parent is None
+
+
+# (id(condition), id(node)) -> result of condition.satisfies(node). Only
+# set within `memoize_satisfies`, while the searched trees are kept alive, so
+# that ids are not reused by other nodes. Context variables rather than
+# globals, so that threads (and asyncio tasks) searching at the same time each
+# see their own memo.
+_satisfies_memo: ContextVar[Optional[dict[tuple[int, int], bool]]] = ContextVar("_satisfies_memo", default=None)
+# (id(condition), id(node)) -> how many times condition.searchNodeIterator(node)
+# yields, for Condition.memoize ones. Same lifetime as _satisfies_memo.
+_search_count_memo: ContextVar[Optional[dict[tuple[int, int], int]]] = ContextVar(
+    "_search_count_memo", default=None
+)
+
+
+@contextmanager
+def memoize_satisfies() -> Generator[None, None, None]:
+    """
+    Cache AbstractCondition.satisfies results within the block, so that a
+    condition re-checked against the same node, e.g., a `Not` reached through
+    different paths of an `And`, is only evaluated once. Expensive Conditions
+    also cache how many matches they have from a node, see Condition.memoize.
+    """
+    satisfies_token = _satisfies_memo.set({})
+    count_token = _search_count_memo.set({})
+    try:
+        yield
+    finally:
+        _search_count_memo.reset(count_token)
+        _satisfies_memo.reset(satisfies_token)
+
+
+# marks an exhausted iterator in next(it, _SENTINEL), as None may be a legit item
+_SENTINEL = object()
+
+
+def _declare_name(names: set[str], name: str, *, unique: bool) -> None:
+    if unique and name in names:
+        raise ParseException(f"Variable '{name}' was declared twice in the scope of the same conjunction.")
+    names.add(name)
+
 
 class AbstractCondition(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self):
         raise NotImplementedError
 
     def satisfies(self, t: "Tree") -> bool:
-        try:
-            next(self.searchNodeIterator(t))
-        except StopIteration:
-            return False
-        else:
-            return True
+        memo = _satisfies_memo.get()
+        # checking a condition that binds names collects nodes for them each
+        # time, which a cached result would skip, as for Condition.memoize
+        if memo is None or self.binds_names():
+            return self._satisfies(t)
+
+        key = (id(self), id(t))
+        ret = memo.get(key)
+        if ret is None:
+            ret = memo[key] = self._satisfies(t)
+        return ret
+
+    def _satisfies(self, t: "Tree") -> bool:
+        return next(self.searchNodeIterator(t), _SENTINEL) is not _SENTINEL
 
     @abstractmethod
     def searchNodeIterator(self, t: "Tree") -> Generator["Tree", None, None]:
         raise NotImplementedError
 
+    @abstractmethod
+    def finalize(self) -> None:
+        """
+        Called once by the parser after the whole condition tree is built:
+        collects declared names and raises ParseException on conflicts.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _collect_declared_names(self, names: set[str], *, unique: bool) -> None:
+        """
+        Add the names this condition declares to `names`. With `unique`, as in
+        the scope of a conjunction, a name already in `names` raises
+        ParseException.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def est_cost(self) -> int:
+        """rough cost of one searchNodeIterator call"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def binds_names(self) -> bool:
+        """whether searching collects nodes for any named node, at any depth"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def structure(self) -> tuple:
+        """
+        A hashable description of the condition, equal for conditions that
+        match the same way. Unlike the repr, it does not confuse relations that
+        print alike, see AbstractRelationData.structure.
+        """
+        raise NotImplementedError
+
+
 class Condition(AbstractCondition):
+    __slots__ = ("relation_data", "node_descriptions", "memoize", "_search")
+
+    # conditions at least this costly cache their match counts, cheaper ones
+    # are faster to search again than to look up
+    MEMOIZE_MIN_COST = 10
+
     def __init__(
         self,
         relation_data: "AbstractRelationData",
@@ -280,13 +728,63 @@ class Condition(AbstractCondition):
     ) -> None:
         self.relation_data = relation_data
         self.node_descriptions = node_descriptions
+        # decided by finalize()
+        self.memoize = False
+        # relation_data bound to node_descriptions, on the first search
+        self._search: Optional[Callable[["Tree"], Iterator["Tree"]]] = None
 
     def __repr__(self):
         return f"{self.relation_data} {self.node_descriptions}"
 
     def searchNodeIterator(self, t: "Tree") -> Generator["Tree", None, None]:
-        for _ in self.relation_data.searchNodeIterator(t, self.node_descriptions):
+        if (search := self._search) is None:
+            search = self._search = self.relation_data.bind(self.node_descriptions)
+
+        memo = _search_count_memo.get()
+        if not self.memoize or memo is None:
+            for _ in search(t):
+                yield t
+            return
+
+        # an And searches each of its conditions once per match of the ones
+        # before, often from the same node, so the count is looked up then
+        key = (id(self), id(t))
+        if (count := memo.get(key)) is not None:
+            yield from repeat(t, count)
+            return
+
+        count = 0
+        for _ in search(t):
+            count += 1
             yield t
+        # only reached if the caller did not stop early
+        memo[key] = count
+
+    def est_cost(self) -> int:
+        cost = self.relation_data.op.EST_COST
+        if (condition := self.node_descriptions.condition) is not None:
+            cost += condition.est_cost()
+        return cost
+
+    def finalize(self) -> None:
+        self.node_descriptions.finalize()
+        self._search = None
+        # searching a condition that binds names has the side effect of
+        # collecting nodes, which a cached count would skip
+        self.memoize = self.est_cost() >= self.MEMOIZE_MIN_COST and not self.binds_names()
+
+    def _collect_declared_names(self, names: set[str], *, unique: bool) -> None:
+        if (name := self.node_descriptions.name) is not None:
+            _declare_name(names, name, unique=unique)
+
+    def binds_names(self) -> bool:
+        node_descriptions = self.node_descriptions
+        if node_descriptions.backref is not None:
+            return True
+        return node_descriptions.condition is not None and node_descriptions.condition.binds_names()
+
+    def structure(self) -> tuple:
+        return (Condition, self.relation_data.structure(), self.node_descriptions.structure())
 
 
 # ----------------------------------------------------------------------------
@@ -294,82 +792,155 @@ class Condition(AbstractCondition):
 
 
 class AbstractLogicCondition(AbstractCondition):
-    ...
+    __slots__ = ()
 
 
 class And(AbstractCondition):
-    def __init__(self, *conds: AbstractCondition):
-        self.conditions = list(conds)
+    __slots__ = ("conditions", "_ordered_conditions", "_repeats", "_binds_names", "names", "_finalized")
 
-        self.names: set[str] = set()
-        # map(self.check_name, conds)
+    def __init__(self, *conds: AbstractCondition):
+        self.conditions: list[AbstractCondition] = []
+        # self.conditions in the order they are searched, see _order_conditions
+        self._ordered_conditions: Optional[list[AbstractCondition]] = None
+        # how often each of self._ordered_conditions is written, set with it
+        self._repeats: tuple[int, ...] = ()
+        # self.binds_names(), set along with self._ordered_conditions
+        self._binds_names = False
         for cond in conds:
-            self.check_name(cond)
+            self._unchecked_append(cond)
 
-    def check_name(self, cond: AbstractCondition):
-        if isinstance(cond, (Not, Opt)):
-            return self.check_name(cond.condition)
-        elif isinstance(cond, Condition):
-            if (name := getattr(cond.node_descriptions, "name", None)) is None:
-                return
-            if name in self.names:
-                raise ParseException(
-                    f"Variable '{name}' was declared twice in the scope of the same conjunction."
-                )
-            else:
-                self.names.add(name)
-        elif isinstance(cond, (And, Or)):
-            comm = cond.names & self.names
-            if comm:
-                raise ParseException(
-                    f"Variable '{comm.pop()}' was declared twice in the scope of the same conjunction."
-                )
-            else:
-                self.names.update(cond.names)
-        else:
-            assert False, f"Unexpected condition type: {type(cond)}"
+        # collected by finalize()
+        self.names: frozenset[str] = frozenset()
+        self._finalized = False
+
+    def finalize(self) -> None:
+        if self._finalized:
+            return
+
+        names: set[str] = set()
+        for cond in self.conditions:
+            cond.finalize()
+            cond._collect_declared_names(names, unique=True)
+        self.names = frozenset(names)
+        self._finalized = True
+
+    def _collect_declared_names(self, names: set[str], *, unique: bool) -> None:
+        for name in self.names:
+            _declare_name(names, name, unique=unique)
 
     def __repr__(self):
         return " ".join(map(str, self.conditions))
 
+    def _order_conditions(self) -> list[AbstractCondition]:
+        """
+        Search cheap conditions first, so that a failing one stops the
+        conjunction before expensive ones are tried. Every condition yields the
+        node it is given, so the order does not change the matches. It does
+        change how many times each condition is searched, though, and thereby
+        what named nodes collect, so conditions binding names keep the order
+        they are written in.
+
+        A condition written more than once, e.g., `< NN` in `NP < NN < NN`, is
+        kept once, and its match count raised to the power of self._repeats.
+        """
+        if any(cond.binds_names() for cond in self.conditions):
+            self._repeats = (1,) * len(self.conditions)
+            return self.conditions
+
+        unique: dict[tuple, AbstractCondition] = {}
+        repeats: dict[tuple, int] = {}
+        for cond in self.conditions:
+            key = cond.structure()
+            unique.setdefault(key, cond)
+            repeats[key] = repeats.get(key, 0) + 1
+        keys = sorted(unique, key=lambda key: unique[key].est_cost())
+        self._repeats = tuple(repeats[key] for key in keys)
+        return [unique[key] for key in keys]
+
     def searchNodeIterator(self, t: "Tree") -> Generator["Tree", None, None]:
-        candidates = (t,)
-        for condition in self.conditions:
-            candidates = tuple(
-                node for candidate in candidates for node in condition.searchNodeIterator(candidate)
-            )
-        yield from candidates
+        if (conditions := self._ordered_conditions) is None:
+            self._binds_names = self.binds_names()
+            conditions = self._ordered_conditions = self._order_conditions()
+
+        if self._binds_names:
+            # each condition has to be searched once per match of the ones
+            # before it, for named nodes to collect what they do. chain the
+            # conditions lazily, so that a caller asking for only the first
+            # match does not pay for the full product of all conditions
+            candidates: Iterable["Tree"] = (t,)
+            for condition in conditions:
+                candidates = _chain.from_iterable(map(condition.searchNodeIterator, candidates))
+            yield from candidates
+            return
+
+        # every condition yields the node it is given, so the conjunction
+        # yields t as many times as the product of the match counts of its
+        # conditions. count each condition once from t, rather than searching
+        # it again for every match of the conditions before it.
+        searches = [condition.searchNodeIterator(t) for condition in conditions]
+        for search in searches:
+            if next(search, _SENTINEL) is _SENTINEL:
+                return
+        yield t
+        # only reached if the caller wants more than the first match
+        count = prod(
+            (1 + sum(1 for _ in search)) ** n for search, n in zip(searches, self._repeats, strict=True)
+        )
+        yield from repeat(t, count - 1)
+
+    def est_cost(self) -> int:
+        return sum(cond.est_cost() for cond in self.conditions)
+
+    def binds_names(self) -> bool:
+        return any(cond.binds_names() for cond in self.conditions)
+
+    def structure(self) -> tuple:
+        return (And, tuple(cond.structure() for cond in self.conditions))
+
+    def _unchecked_append(self, other_condition: AbstractCondition):
+        # inline a nested conjunction, e.g., the parenthesized one in
+        # `NP < DT (< JJ < NN)`, which matches the same as its conditions
+        # written out, so searching it does not stack another level of chained
+        # generators
+        if isinstance(other_condition, And):
+            self.conditions.extend(other_condition.conditions)
+        else:
+            self.conditions.append(other_condition)
+        self._ordered_conditions = None
 
     def append_condition(self, other_condition: AbstractCondition):
-        self.check_name(other_condition)
-        self.conditions.append(other_condition)
+        self._unchecked_append(other_condition)
+        self._finalized = False
 
     def extend_conditions(self, other_conditions: Iterable[AbstractCondition]):
-        for cond in other_conditions:
-            self.check_name(cond)
-        # map(self.check_name, other_conditions)
         self.conditions.extend(other_conditions)
+        self._ordered_conditions = None
+        self._finalized = False
 
 
 class Or(AbstractCondition):
+    __slots__ = ("conditions", "names", "_finalized")
+
     def __init__(self, *conds: AbstractCondition):
         self.conditions = list(conds)
-        self.names: set[str] = set()
-        for cond in conds:
-            self.store_name(cond)
-        # map(self.store_name, conds)
-
-    def store_name(self, cond: AbstractCondition):
-        if isinstance(cond, (Not, Opt)):
-            return self.store_name(cond.condition)
-        elif isinstance(cond, (Condition)):
-            if (name := getattr(cond.node_descriptions, "name", None)) is None:
-                return
-            self.names.add(name)
-        elif isinstance(cond, (And, Or)):
-            self.names.update(cond.names)
-        else:
-            assert False, f"Unexpected condition type: {type(cond)}"
+        # collected by finalize()
+        self.names: frozenset[str] = frozenset()
+        self._finalized = False
+
+    def finalize(self) -> None:
+        if self._finalized:
+            return
+
+        names: set[str] = set()
+        for cond in self.conditions:
+            cond.finalize()
+            cond._collect_declared_names(names, unique=False)
+        self.names = frozenset(names)
+        self._finalized = True
+
+    def _collect_declared_names(self, names: set[str], *, unique: bool) -> None:
+        for name in self.names:
+            _declare_name(names, name, unique=unique)
 
     def __repr__(self):
         return f"[ {' || '.join(map(str, self.conditions))} ]"
@@ -378,50 +949,89 @@ class Or(AbstractCondition):
         for condition in self.conditions:
             yield from condition.searchNodeIterator(t)
 
-    def append_condition(self, other_condition):
+    def est_cost(self) -> int:
+        return sum(cond.est_cost() for cond in self.conditions)
+
+    def binds_names(self) -> bool:
+        return any(cond.binds_names() for cond in self.conditions)
+
+    def structure(self) -> tuple:
+        return (Or, tuple(cond.structure() for cond in self.conditions))
+
+    def _unchecked_append(self, other_condition):
         self.conditions.append(other_condition)
-        self.store_name(other_condition)
+
+    def append_condition(self, other_condition):
+        self._unchecked_append(other_condition)
+        self._finalized = False
 
     def extend_conditions(self, other_conditions):
         self.conditions.extend(other_conditions)
-        for cond in other_conditions:
-            self.store_name(cond)
-        # map(self.store_name, other_conditions)
+        self._finalized = False
 
 
 class Not(AbstractCondition):
+    __slots__ = ("condition",)
+
     def __init__(self, condition: AbstractCondition):
         self.condition = condition
 
+    def finalize(self) -> None:
+        self.condition.finalize()
+
+    def _collect_declared_names(self, names: set[str], *, unique: bool) -> None:
+        self.condition._collect_declared_names(names, unique=unique)
+
     def __repr__(self):
         return f"!{self.condition}"
 
     def searchNodeIterator(self, t: "Tree") -> Generator["Tree", None, None]:
-        try:
-            next(self.condition.searchNodeIterator(t))
-        except StopIteration:
+        if not self.condition.satisfies(t):
             yield t
-        else:
-            return
+
+    def est_cost(self) -> int:
+        return self.condition.est_cost()
+
+    def binds_names(self) -> bool:
+        return self.condition.binds_names()
+
+    def structure(self) -> tuple:
+        return (Not, self.condition.structure())
 
 
 class Opt(AbstractCondition):
+    __slots__ = ("condition",)
+
     def __init__(self, condition: AbstractCondition):
         self.condition = condition
 
+    def finalize(self) -> None:
+        self.condition.finalize()
+
+    def _collect_declared_names(self, names: set[str], *, unique: bool) -> None:
+        self.condition._collect_declared_names(names, unique=unique)
+
     def __repr__(self):
         return f"?[{self.condition}]"
 
     def searchNodeIterator(self, t: "Tree") -> Generator["Tree", None, None]:
         g = self.condition.searchNodeIterator(t)
-        try:
-            node = next(g)
-        except StopIteration:
+        node = next(g, _SENTINEL)
+        if node is _SENTINEL:
             yield t
         else:
             yield node
             yield from g
 
+    def est_cost(self) -> int:
+        return self.condition.est_cost()
+
+    def binds_names(self) -> bool:
+        return self.condition.binds_names()
+
+    def structure(self) -> tuple:
+        return (Opt, self.condition.structure())
+
 
 """
 echo '(foo bar (rab (baz bar)))' | python -m pytregex 'foo=a <bar=a << baz=a' -filter -h a
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
 from abc import ABC, abstractmethod
+from functools import partial
 from itertools import chain as _chain
-from typing import TYPE_CHECKING, Generator, Iterator, List, Optional
+from typing import TYPE_CHECKING, Callable, Generator, Iterator, List, Optional
 
 from .collins_head_finder import CollinsHeadFinder
 
@@ -22,6 +23,9 @@ if TYPE_CHECKING:
 
 class AbstractRelation(ABC):
     symbol: Optional[str] = None
+    # rough cost of one searchNodeIterator call, used to decide the order in
+    # which the conditions of a conjunction are searched
+    EST_COST: int = 10
 
     @classmethod
     @abstractmethod
@@ -36,6 +40,7 @@ class AbstractRelation(ABC):
 
 class DOMINATES(AbstractRelation):
     symbol: Optional[str] = "<<"
+    EST_COST = 10
 
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
@@ -51,14 +56,19 @@ class DOMINATES(AbstractRelation):
 
     @classmethod
     def searchNodeIterator(cls, t: "Tree") -> Generator["Tree", None, None]:
-        iterator = iter(t.children)
-        while (node := next(iterator, None)) is not None:
+        # same walk as Tree.preorder_iter, without t itself
+        stack = t.children[::-1]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
             yield node
-            if not node.isLeaf():
-                iterator = _chain(node.children, iterator)
+            if children := node.children:
+                extend(reversed(children))
 
 
 class DOMINATED_BY(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return DOMINATES.satisfies(t2, t1)
@@ -72,6 +82,8 @@ class DOMINATED_BY(AbstractRelation):
 
 
 class ONLY_CHILD_OF(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         those_children = t2.children
@@ -85,6 +97,8 @@ class ONLY_CHILD_OF(AbstractRelation):
 
 
 class HAS_ONLY_CHILD(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return ONLY_CHILD_OF.satisfies(t2, t1)
@@ -96,6 +110,8 @@ class HAS_ONLY_CHILD(AbstractRelation):
 
 
 class LAST_CHILD_OF_PARENT(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         those_children = t2.children
@@ -109,6 +125,8 @@ class LAST_CHILD_OF_PARENT(AbstractRelation):
 
 
 class PARENT_OF_LAST_CHILD(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return LAST_CHILD_OF_PARENT.satisfies(t2, t1)
@@ -121,6 +139,8 @@ class PARENT_OF_LAST_CHILD(AbstractRelation):
 
 
 class LEFTMOST_CHILD_OF(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         those_children = t2.children
@@ -134,6 +154,8 @@ class LEFTMOST_CHILD_OF(AbstractRelation):
 
 
 class HAS_LEFTMOST_CHILD(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return LEFTMOST_CHILD_OF.satisfies(t2, t1)
@@ -146,6 +168,8 @@ class HAS_LEFTMOST_CHILD(AbstractRelation):
 
 
 class HAS_RIGHTMOST_DESCENDANT(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         if t1.isLeaf():
@@ -162,6 +186,8 @@ class HAS_RIGHTMOST_DESCENDANT(AbstractRelation):
 
 
 class RIGHTMOST_DESCENDANT_OF(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return HAS_RIGHTMOST_DESCENDANT.satisfies(t2, t1)
@@ -177,6 +203,8 @@ class RIGHTMOST_DESCENDANT_OF(AbstractRelation):
 
 
 class HAS_LEFTMOST_DESCENDANT(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         if t1.isLeaf():
@@ -193,6 +221,8 @@ class HAS_LEFTMOST_DESCENDANT(AbstractRelation):
 
 
 class LEFTMOST_DESCENDANT_OF(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return HAS_LEFTMOST_DESCENDANT.satisfies(t2, t1)
@@ -208,6 +238,8 @@ class LEFTMOST_DESCENDANT_OF(AbstractRelation):
 
 
 class LEFT_SISTER_OF(AbstractRelation):
+    EST_COST = 2
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         # t1 is t2 or t1 is root
@@ -234,6 +266,8 @@ class LEFT_SISTER_OF(AbstractRelation):
 
 
 class RIGHT_SISTER_OF(AbstractRelation):
+    EST_COST = 2
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return LEFT_SISTER_OF.satisfies(t2, t1)
@@ -249,6 +283,8 @@ class RIGHT_SISTER_OF(AbstractRelation):
 
 
 class IMMEDIATE_LEFT_SISTER_OF(AbstractRelation):
+    EST_COST = 2
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         # t1 is t2 or t1 is root
@@ -275,6 +311,8 @@ class IMMEDIATE_LEFT_SISTER_OF(AbstractRelation):
 
 
 class IMMEDIATE_RIGHT_SISTER_OF(AbstractRelation):
+    EST_COST = 2
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return IMMEDIATE_LEFT_SISTER_OF.satisfies(t2, t1)
@@ -291,6 +329,8 @@ class IMMEDIATE_RIGHT_SISTER_OF(AbstractRelation):
 
 
 class PARENT_OF(AbstractRelation):
+    EST_COST = 2
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return t2.parent is t1
@@ -301,6 +341,8 @@ class PARENT_OF(AbstractRelation):
 
 
 class CHILD_OF(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return PARENT_OF.satisfies(t2, t1)
@@ -313,6 +355,8 @@ class CHILD_OF(AbstractRelation):
 
 
 class SISTER_OF(AbstractRelation):
+    EST_COST = 2
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         if t1 is t2 or t1.parent is None:
@@ -331,6 +375,8 @@ class SISTER_OF(AbstractRelation):
 
 
 class EQUALS(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return t1 is t2
@@ -341,6 +387,8 @@ class EQUALS(AbstractRelation):
 
 
 class PARENT_EQUALS(AbstractRelation):
+    EST_COST = 2
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         if t1 is t2:
@@ -354,6 +402,8 @@ class PARENT_EQUALS(AbstractRelation):
 
 
 class UNARY_PATH_ANCESTOR_OF(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         if t1.isLeaf() or t1.numChildren() > 1:
@@ -374,6 +424,8 @@ class UNARY_PATH_ANCESTOR_OF(AbstractRelation):
 
 
 class UNARY_PATH_DESCEDANT_OF(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return UNARY_PATH_ANCESTOR_OF.satisfies(t2, t1)
@@ -387,6 +439,8 @@ class UNARY_PATH_DESCEDANT_OF(AbstractRelation):
 
 
 class HEADS(AbstractRelation):
+    EST_COST = 5
+
     hf = CollinsHeadFinder()
 
     @classmethod
@@ -421,6 +475,8 @@ class HEADS(AbstractRelation):
 
 
 class HEADED_BY(AbstractRelation):
+    EST_COST = 5
+
     hf = CollinsHeadFinder()
 
     @classmethod
@@ -441,6 +497,8 @@ class HEADED_BY(AbstractRelation):
 
 
 class IMMEDIATELY_HEADS(AbstractRelation):
+    EST_COST = 5
+
     hf = CollinsHeadFinder()
 
     @classmethod
@@ -462,6 +520,8 @@ class IMMEDIATELY_HEADS(AbstractRelation):
 
 
 class IMMEDIATELY_HEADED_BY(AbstractRelation):
+    EST_COST = 5
+
     hf = CollinsHeadFinder()
 
     @classmethod
@@ -482,6 +542,8 @@ class IMMEDIATELY_HEADED_BY(AbstractRelation):
 
 
 class PRECEDES(AbstractRelation):
+    EST_COST = 20
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return t1.rightEdge() <= t2.leftEdge()
@@ -498,13 +560,17 @@ class PRECEDES(AbstractRelation):
                 searchStack.append(kid)
             current = parent_
             parent_ = parent_.parent
+        pop, extend = searchStack.pop, searchStack.extend
         while searchStack:
-            next = searchStack.pop()
+            next = pop()
             yield next
-            searchStack.extend(reversed(next.children))
+            if children := next.children:
+                extend(reversed(children))
 
 
 class IMMEDIATELY_PRECEDES(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return t1.rightEdge() == t2.leftEdge()
@@ -533,6 +599,8 @@ class IMMEDIATELY_PRECEDES(AbstractRelation):
 
 
 class FOLLOWS(AbstractRelation):
+    EST_COST = 20
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return t2.rightEdge() <= t1.leftEdge()
@@ -549,13 +617,17 @@ class FOLLOWS(AbstractRelation):
                 searchStack.append(kid)
             current = parent_
             parent_ = parent_.parent
+        pop, extend = searchStack.pop, searchStack.extend
         while searchStack:
-            next = searchStack.pop()
+            next = pop()
             yield next
-            searchStack.extend(reversed(next.children))
+            if children := next.children:
+                extend(reversed(children))
 
 
 class IMMEDIATELY_FOLLOWS(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return t2.rightEdge() == t1.leftEdge()
@@ -584,6 +656,8 @@ class IMMEDIATELY_FOLLOWS(AbstractRelation):
 
 
 class ANCESTOR_OF_LEAF(AbstractRelation):
+    EST_COST = 10
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return t1 is not t2 and t2.isLeaf() and DOMINATES.satisfies(t1, t2)
@@ -599,6 +673,8 @@ class ANCESTOR_OF_LEAF(AbstractRelation):
 
 
 class UNBROKEN_CATEGORY_DOMINATES(AbstractRelation):
+    EST_COST = 10
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree", descs: "NodeDescriptions") -> bool:
         # TODO passing in rel_arg is expansive, may be passing in node_descriptions is better?
@@ -606,9 +682,7 @@ class UNBROKEN_CATEGORY_DOMINATES(AbstractRelation):
             if kid is t2:
                 return True
             else:
-                if descs._satisfies_ignore_condition(kid) and UNBROKEN_CATEGORY_DOMINATES.satisfies(
-                    kid, t2, descs
-                ):
+                if descs.match(kid) and UNBROKEN_CATEGORY_DOMINATES.satisfies(kid, t2, descs):
                     return True
         return False
 
@@ -616,33 +690,39 @@ class UNBROKEN_CATEGORY_DOMINATES(AbstractRelation):
     def searchNodeIterator(cls, t: "Tree", descs: "NodeDescriptions") -> Generator["Tree", None, None]:
         # TODO might need to implement a TregexMatcher class like java tregex
         # https://github.com/stanfordnlp/CoreNLP/blob/f8838d2639589f684cbaa58964cb29db5f23df7f/src/edu/stanford/nlp/trees/tregex/Relation.java#L1525
+        match = descs.match
         iterator = iter(t.children)
         while (node := next(iterator, None)) is not None:
             # chain of length zero
             yield node
             # chain of length longer than 0
-            if descs._satisfies_ignore_condition(node):
+            if match(node):
                 iterator = _chain(node.children, iterator)
 
 
 class UNBROKEN_CATEGORY_IS_DOMINATED_BY(AbstractRelation):
+    EST_COST = 5
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree", descs: "NodeDescriptions") -> bool:
         return UNBROKEN_CATEGORY_DOMINATES.satisfies(t2, t1, descs)
 
     @classmethod
     def searchNodeIterator(cls, t: "Tree", descs: "NodeDescriptions") -> Generator["Tree", None, None]:
+        match = descs.match
         parent_ = t.parent
         while True:
             if parent_ is None:
                 break
             yield parent_
-            if not descs._satisfies_ignore_condition(parent_):
+            if not match(parent_):
                 break
             parent_ = parent_.parent
 
 
 class UNBROKEN_CATEGORY_PRECEDES(AbstractRelation):
+    EST_COST = 10
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree", descs: "NodeDescriptions") -> bool:
         parent_ = t1.parent
@@ -663,7 +743,7 @@ class UNBROKEN_CATEGORY_PRECEDES(AbstractRelation):
         if immediate_follower is t2:
             return True
         else:
-            if descs._satisfies_ignore_condition(immediate_follower) and UNBROKEN_CATEGORY_PRECEDES.satisfies(
+            if descs.match(immediate_follower) and UNBROKEN_CATEGORY_PRECEDES.satisfies(
                 immediate_follower, t2, descs
             ):
                 return True
@@ -671,28 +751,34 @@ class UNBROKEN_CATEGORY_PRECEDES(AbstractRelation):
 
     @classmethod
     def searchNodeIterator(cls, t: "Tree", descs: "NodeDescriptions") -> Generator["Tree", None, None]:
-        iterator: Iterator = IMMEDIATELY_PRECEDES.searchNodeIterator(t)
+        match, search = descs.match, IMMEDIATELY_PRECEDES.searchNodeIterator
+        iterator: Iterator = search(t)
         while (node := next(iterator, None)) is not None:
             yield node
-            if descs._satisfies_ignore_condition(node):
-                iterator = _chain(IMMEDIATELY_PRECEDES.searchNodeIterator(node), iterator)
+            if match(node):
+                iterator = _chain(search(node), iterator)
 
 
 class UNBROKEN_CATEGORY_FOLLOWS(AbstractRelation):
+    EST_COST = 10
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree", descs: "NodeDescriptions") -> bool:
         return UNBROKEN_CATEGORY_PRECEDES.satisfies(t2, t1, descs)
 
     @classmethod
     def searchNodeIterator(cls, t: "Tree", descs: "NodeDescriptions") -> Generator["Tree", None, None]:
-        iterator: Iterator = IMMEDIATELY_FOLLOWS.searchNodeIterator(t)
+        match, search = descs.match, IMMEDIATELY_FOLLOWS.searchNodeIterator
+        iterator: Iterator = search(t)
         while (node := next(iterator, None)) is not None:
             yield node
-            if descs._satisfies_ignore_condition(node):
-                iterator = _chain(IMMEDIATELY_FOLLOWS.searchNodeIterator(node), iterator)
+            if match(node):
+                iterator = _chain(search(node), iterator)
 
 
 class PATTERN_SPLITTER(AbstractRelation):
+    EST_COST = 20
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree") -> bool:
         return True
@@ -700,10 +786,12 @@ class PATTERN_SPLITTER(AbstractRelation):
     @classmethod
     def searchNodeIterator(cls, t: "Tree") -> Generator["Tree", None, None]:
         root = t.getRoot()
-        return root.preorder_iter()
+        return iter(root.preorder_list())
 
 
 class ITH_CHILD_OF(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree", child_num: int) -> bool:
         if child_num == 0:
@@ -734,6 +822,8 @@ class ITH_CHILD_OF(AbstractRelation):
 
 
 class HAS_ITH_CHILD(AbstractRelation):
+    EST_COST = 1
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree", child_num: int) -> bool:
         return ITH_CHILD_OF.satisfies(t2, t1, child_num)
@@ -753,6 +843,8 @@ class HAS_ITH_CHILD(AbstractRelation):
 
 
 class ANCESTOR_OF_ITH_LEAF(AbstractRelation):
+    EST_COST = 10
+
     @classmethod
     def satisfies(cls, t1: "Tree", t2: "Tree", leaf_num: int) -> bool:
         if leaf_num == 0:
@@ -791,7 +883,22 @@ class ANCESTOR_OF_ITH_LEAF(AbstractRelation):
 # RelationData
 
 
+def _match_candidates(candidates: Iterator["Tree"], node_descriptions: "NodeDescriptions") -> Iterator["Tree"]:
+    """
+    Return the `candidates` of a relation that match `node_descriptions`. A
+    module-level function rather than a method, as it runs once per searched
+    node and a global lookup is cheaper than a method lookup.
+    """
+    if node_descriptions.condition is None and node_descriptions.backref is None:
+        # nothing to do beyond matching each candidate, so skip the
+        # generator node_descriptions.searchNodeIterator would set up for it
+        return filter(node_descriptions.match, candidates)
+    return _chain.from_iterable(map(partial(node_descriptions.searchNodeIterator, recursive=False), candidates))
+
+
 class AbstractRelationData(ABC):
+    __slots__ = ("op", "symbol")
+
     def __init__(self, op: type[AbstractRelation], symbol: str):
         self.op = op
         self.symbol = symbol
@@ -799,32 +906,63 @@ class AbstractRelationData(ABC):
     def __repr__(self) -> str:
         return f"{self.symbol}{getattr(self, 'arg', '')}"
 
+    def structure(self) -> tuple:
+        """
+        What tells relations apart, for comparing conditions. Not the repr,
+        which writes the symbol and the argument side by side, e.g., `<11` for
+        both the user-written `<1` and the 11th child of a `<...` expansion.
+        """
+        return (self.op, getattr(self, "arg", None))
+
     @abstractmethod
-    def searchNodeIterator(
-        self, t: "Tree", node_descriptions: "NodeDescriptions"
-    ) -> Generator["Tree", None, None]:
+    def searchNodeIterator(self, t: "Tree", node_descriptions: "NodeDescriptions") -> Iterator["Tree"]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bind_op(self) -> Callable[["Tree"], Iterator["Tree"]]:
+        """op.searchNodeIterator with the argument of the relation, if any, fixed"""
         raise NotImplementedError()
 
+    def bind(self, node_descriptions: "NodeDescriptions") -> Callable[["Tree"], Iterator["Tree"]]:
+        """
+        Return the equivalent of searchNodeIterator with `node_descriptions`
+        fixed. The op and how to match its candidates are resolved once here,
+        so that each search takes one Python call to get to the op, instead of
+        going through searchNodeIterator and _match_candidates.
+        """
+        search = self.bind_op()
+        if node_descriptions.condition is None and node_descriptions.backref is None:
+            if (match_const := node_descriptions.match_const) is not None:
+                return search if match_const else lambda t: ()
+            match = node_descriptions.match
+            return lambda t: filter(match, search(t))
+        search_matched = partial(node_descriptions.searchNodeIterator, recursive=False)
+        return lambda t: _chain.from_iterable(map(search_matched, search(t)))
+
     # @abstractmethod
     # def satisfies(self, this_node: "Tree", that_node: "Tree") -> bool:
     #     raise NotImplementedError()
 
 
 class RelationData(AbstractRelationData):
+    __slots__ = ()
+
     def __init__(self, op: type[AbstractRelation], symbol: str) -> None:
         super().__init__(op, symbol)
 
-    def searchNodeIterator(
-        self, t: "Tree", node_descriptions: "NodeDescriptions"
-    ) -> Generator["Tree", None, None]:
-        for candidate in self.op.searchNodeIterator(t):
-            yield from node_descriptions.searchNodeIterator(candidate, recursive=False)
+    def searchNodeIterator(self, t: "Tree", node_descriptions: "NodeDescriptions") -> Iterator["Tree"]:
+        return _match_candidates(self.op.searchNodeIterator(t), node_descriptions)
+
+    def bind_op(self) -> Callable[["Tree"], Iterator["Tree"]]:
+        return self.op.searchNodeIterator
 
     # def satisfies(self, this_node: "Tree", that_node: "Tree") -> bool:
     #     return self.op.satisfies(this_node, that_node)
 
 
 class RelationWithStrArgData(AbstractRelationData):
+    __slots__ = ("arg",)
+
     def __init__(
         self,
         op: type[AbstractRelation],
@@ -835,17 +973,23 @@ class RelationWithStrArgData(AbstractRelationData):
         super().__init__(op, symbol)
         self.arg = arg
 
-    def searchNodeIterator(
-        self, t: "Tree", node_descriptions: "NodeDescriptions"
-    ) -> Generator["Tree", None, None]:
-        for candidate in self.op.searchNodeIterator(t, self.arg):
-            yield from node_descriptions.searchNodeIterator(candidate, recursive=False)
+    def structure(self) -> tuple:
+        return (self.op, self.arg.structure())
+
+    def searchNodeIterator(self, t: "Tree", node_descriptions: "NodeDescriptions") -> Iterator["Tree"]:
+        return _match_candidates(self.op.searchNodeIterator(t, self.arg), node_descriptions)
+
+    def bind_op(self) -> Callable[["Tree"], Iterator["Tree"]]:
+        search, arg = self.op.searchNodeIterator, self.arg
+        return lambda t: search(t, arg)
 
     # def satisfies(self, this_node: "Tree", that_node: "Tree") -> bool:
     #     return self.op.satisfies(this_node, that_node, self.arg)
 
 
 class RelationWithNumArgData(AbstractRelationData):
+    __slots__ = ("arg",)
+
     def __init__(
         self,
         op: type[AbstractRelation],
@@ -856,11 +1000,12 @@ class RelationWithNumArgData(AbstractRelationData):
         super().__init__(op, symbol)
         self.arg = arg
 
-    def searchNodeIterator(
-        self, t: "Tree", node_descriptions: "NodeDescriptions"
-    ) -> Generator["Tree", None, None]:
-        for candidate in self.op.searchNodeIterator(t, self.arg):
-            yield from node_descriptions.searchNodeIterator(candidate, recursive=False)
+    def searchNodeIterator(self, t: "Tree", node_descriptions: "NodeDescriptions") -> Iterator["Tree"]:
+        return _match_candidates(self.op.searchNodeIterator(t, self.arg), node_descriptions)
+
+    def bind_op(self) -> Callable[["Tree"], Iterator["Tree"]]:
+        search, arg = self.op.searchNodeIterator, self.arg
+        return lambda t: search(t, arg)
 
     # def searchNodeIterator(self, this_node: "Tree") -> Generator["Tree", None, None]:
     #     return self.op.searchNodeIterator(this_node, self.arg)
@@ -1,10 +1,12 @@
 # translated from [CoreNLP](https://github.com/stanfordnlp/CoreNLP/blob/139893242878ecacde79b2ba1d0102b855526610/src/edu/stanford/nlp/trees/Tree.java)
 
 import re
+import sys
 from collections import deque
-from collections.abc import Generator, Iterator
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from io import StringIO
-from itertools import chain as _chain
 from typing import TYPE_CHECKING, Optional
 
 from .peekable import peekable
@@ -18,6 +20,28 @@ LRB_ESCAPE: str = "-LRB-"
 RRB_ESCAPE: str = "-RRB-"
 SPACE_SEPARATOR: str = " "
 
+# the nodes whose preorder has been cached. Only set within `cache_preorder`
+_preorder_cached_nodes: ContextVar[Optional[list["Tree"]]] = ContextVar("_preorder_cached_nodes", default=None)
+
+
+@contextmanager
+def cache_preorder() -> Generator[None, None, None]:
+    """
+    Cache Tree.preorder_list and Tree.preorder_labels within the block, so that
+    searching a tree several times, e.g., by each pattern of a `;` separated
+    list, only walks it once. The caches are dropped on exit, so the trees can
+    be edited afterwards by any means, including assigning to `children`,
+    `parent` or `label` directly. They must not be edited within the block.
+    """
+    nodes: list[Tree] = []
+    token = _preorder_cached_nodes.set(nodes)
+    try:
+        yield
+    finally:
+        _preorder_cached_nodes.reset(token)
+        for node in nodes:
+            node._preorder_cache = node._preorder_labels_cache = None
+
 
 class Tree:
     def __init__(
@@ -26,6 +50,11 @@ class Tree:
         children: list["Tree"] | None = None,
         parent: Optional["Tree"] = None,
     ):
+        # each subtree has at most one parent
+        self.parent = parent
+        # see cache_preorder
+        self._preorder_cache: list[Tree] | None = None
+        self._preorder_labels_cache: list[str] | None = None
         self.set_label(label)
         if children is None:
             self.children = []
@@ -33,8 +62,6 @@ class Tree:
             for child in children:
                 child.parent = self  # type:ignore
             self.children = children
-        # each subtree has at most one parent
-        self.parent = parent
 
     def __repr__(self):
         # https://github.com/stanfordnlp/stanza/blob/c2d72bd14cf8cc28bd4e41a620692bbce5f43835/stanza/models/constituency/parse_tree.py#L118
@@ -314,7 +341,9 @@ class Tree:
 
     def set_label(self, label: str | None) -> None:
         if isinstance(label, str):
-            self.label: str | None = self.normalize(label)
+            # interned, so that comparing it against the likewise interned
+            # values of node descriptions short-circuits on identity
+            self.label: str | None = sys.intern(self.normalize(label))
         elif label is None:
             self.label = None
         else:
@@ -368,7 +397,9 @@ class Tree:
                 if current_tree is None:
                     stack_parent.append(new_tree)
                 else:
-                    current_tree.add_child(new_tree)
+                    # not add_child: nodes being built have no preorder cache to clear
+                    new_tree.parent = current_tree
+                    current_tree.children.append(new_tree)
                     stack_parent.append(current_tree)
 
                 current_tree = new_tree
@@ -390,7 +421,8 @@ class Tree:
                     continue
 
                 new_tree = cls(token)
-                current_tree.add_child(new_tree)
+                new_tree.parent = current_tree
+                current_tree.children.append(new_tree)
 
         if current_tree is not None:
             raise ValueError("incomplete tree (extra left parentheses in input)")
@@ -430,15 +462,67 @@ class Tree:
         return repr(self)
 
     def preorder_iter(self) -> Generator["Tree", None, None]:
+        # a live walk, unlike preorder_list, so it sees edits made to the tree
+        # however they were made
         if not self:
             raise ValueError("Trying to iterate an empty tree")
 
-        yield self
-        iterator: Iterator = iter(self.children)
-        while (node := next(iterator, None)) is not None:
+        # an explicit stack rather than nesting itertools.chain once per
+        # subtree, which slows down every step on deep trees
+        stack = [self]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
             yield node
-            if not node.isLeaf():
-                iterator = _chain(node.children, iterator)
+            if children := node.children:
+                extend(reversed(children))
+
+    def preorder_list(self) -> list["Tree"]:
+        """
+        Return the nodes of the tree in preorder. Within `cache_preorder`, the
+        list is built on the first call and cached, and must not be modified.
+        """
+        if (ret := self._preorder_cache) is not None:
+            return ret
+        if not self:
+            raise ValueError("Trying to iterate an empty tree")
+
+        ret = []
+        append = ret.append
+        stack = [self]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            append(node)
+            if children := node.children:
+                extend(reversed(children))
+        if (cached_nodes := _preorder_cached_nodes.get()) is not None:
+            self._preorder_cache = ret
+            cached_nodes.append(self)
+        return ret
+
+    def preorder_collect(self, pred: Callable[["Tree"], bool]) -> list["Tree"]:
+        """
+        Return the nodes satisfying `pred` in preorder. Equivalent to
+        `list(filter(pred, self.preorder_iter()))` but filters `preorder_list`
+        instead of resuming a generator for every node.
+        """
+        return list(filter(pred, self.preorder_list()))
+
+    def preorder_labels(self) -> list[str]:
+        """
+        Return the labels of `preorder_list`, with "" for nodes without one,
+        for a label predicate to be mapped over at C speed instead of calling a
+        Python function per node. Cached like `preorder_list`.
+        """
+        if (ret := self._preorder_labels_cache) is not None:
+            return ret
+        nodes = self.preorder_list()
+        ret = [node.label or "" for node in nodes]
+        # cached only if the nodes are, so that cache_preorder drops it too
+        if self._preorder_cache is nodes:
+            self._preorder_labels_cache = ret
+        return ret
 
     def getLeaves(self) -> list["Tree"]:
         """
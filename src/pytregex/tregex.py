@@ -1,6 +1,9 @@
+import copy
 import logging
 import re
+import sys
 import warnings
+from collections.abc import Iterable
 from typing import List, Never
 
 from . import relation as _r
@@ -18,10 +21,36 @@ from .condition import (
     Not,
     Opt,
     Or,
+    memoize_satisfies,
 )
 from .exceptions import ParseException
 from .ply import lex, yacc
-from .tree import Tree
+from .tree import Tree, cache_preorder
+
+
+def _trie_regex(symbols: Iterable[str]) -> str:
+    """
+    Build a regex matching any of `symbols`, with common prefixes factored out
+    and longer symbols tried first, e.g., ["<", "<<", "<-"] gives "<(?:\\-|<)?".
+    """
+    trie: dict[str, dict] = {}
+    for symbol in symbols:
+        node = trie
+        for char in symbol:
+            node = node.setdefault(char, {})
+        # an empty key marks the end of a symbol
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        # the greedy "?" tries the longer symbols before stopping here
+        return f"(?:{'|'.join(branches)})" + ("?" if "" in node else "")
+
+    return build(trie)
 
 
 class TregexPattern:
@@ -99,14 +128,14 @@ class TregexPattern:
         "ROOT",
     ]
 
-    # make sure long relations are checked first, or otherwise `>>` might
-    # be tokenized as two `>`s.
-    rels = sorted(RELATION_MAP.keys(), key=len, reverse=True)
+    # relations share prefixes, so match them with a trie-shaped regex rather
+    # than an alternation of all of them, which has re try every symbol in
+    # turn. the trie tries longer symbols first, or otherwise `>>` might be
+    # tokenized as two `>`s.
     # add negative lookahead assertion to ensure ">+" is seen as REL_W_STR_ARG instead of RELATION(">") and ID("+")
-    t_RELATION = r"(?:" + "|".join(map(re.escape, rels)) + r")(?![\+\.])"
+    t_RELATION = _trie_regex(RELATION_MAP) + r"(?![\+\.])"
 
-    rels_w_arg = sorted(REL_W_STR_ARG_MAP.keys(), key=len, reverse=True)
-    t_REL_W_STR_ARG = "|".join(map(re.escape, rels_w_arg))
+    t_REL_W_STR_ARG = _trie_regex(REL_W_STR_ARG_MAP)
 
     # REL_W_NUM_ARG don't have to be declared, as they have already been as t_RELATION
 
@@ -126,8 +155,16 @@ class TregexPattern:
 
     literals = "!?()[]{}@&=~;"
 
+    # built on the first make_parser call, see there
+    _shared_parser: "yacc.LRParser | None" = None
+    # built by the first instance and cloned by the others, as the token rules
+    # are all class attributes
+    _shared_lexer: "lex.Lexer | None" = None
+
     def __init__(self, tregex_pattern: str) -> None:
-        self.lexer = lex.lex(module=self)
+        if (shared_lexer := type(self)._shared_lexer) is None:
+            shared_lexer = type(self)._shared_lexer = lex.lex(module=self)
+        self.lexer = shared_lexer.clone(self)
         self.lexer.input(tregex_pattern)
 
         self.pattern = tregex_pattern
@@ -135,15 +172,41 @@ class TregexPattern:
         # > some nonsense patterns such as ones that reset variables or link
         # > to variables that haven't been set
         self.backref_table: dict[str, BackRef] = {}
+        # parsed from the pattern on the first findall, see compile
+        self._node_descriptions_list: list[NodeDescriptions] | None = None
 
     def findall(self, tree_string: str) -> List[Tree]:
-        # TODO: must tupleize?
-        trees = tuple(Tree.fromstring(tree_string))
-        parser = self.make_parser(trees)
-        self._reset_lexer_state()
+        trees = Tree.fromstring(tree_string)
+        node_descriptions_list = self.compile()
+        # forget the nodes named during the previous findall
+        for backref in self.backref_table.values():
+            backref.nodes = None
+
+        nodes: list[Tree] = []
+        for tree in trees:
+            # one memo per tree: it is keyed by node ids, which are only
+            # unique while the tree is alive, and trees without matches are
+            # freed as soon as the next one is parsed
+            with memoize_satisfies(), cache_preorder():
+                for node_descriptions in node_descriptions_list:
+                    nodes.extend(node_descriptions.searchNodeIterator(tree))
+        return nodes
 
-        return parser.parse(lexer=self.lexer, debug=(logging.getLogger().level == logging.DEBUG))
-        # return parser.parse(lexer=self.lexer)
+    def compile(self) -> list[NodeDescriptions]:
+        """
+        Parse the pattern into the node descriptions to search trees with. This
+        is done once per pattern, findall then only runs the searches.
+        """
+        if self._node_descriptions_list is None:
+            parser = self.make_parser()
+            # rewind the lexer, and forget the names declared, in case an
+            # earlier parse failed halfway
+            self.lexer.input(self.pattern)
+            self.backref_table = {}
+            self._node_descriptions_list = parser.parse(
+                lexer=self.lexer, debug=(logging.getLogger().level == logging.DEBUG)
+            )
+        return self._node_descriptions_list
 
     def get_nodes(self, name: str) -> List[Tree]:
         try:
@@ -156,410 +219,460 @@ class TregexPattern:
             assert backref.nodes is not None
             return backref.nodes
 
-    def _reset_lexer_state(self) -> None:
+    def make_parser(self) -> yacc.LRParser:
         """
-        reset lexer.lexpos to make the lexer reusable
-        https://github.com/dabeaz/ply/blob/master/doc/ply.md#internal-lexer-state
+        Return a parser bound to this pattern. Building the LALR tables is the
+        expensive part, so that is done once and the resulting parser is shared
+        by shallow copies, each of which carries its own pattern.
         """
-        self.lexer.lexpos = 0
-
-    def make_parser(self, trees: tuple[Tree, ...]):
-        tokens = self.tokens
-
-        precedence = (
-            # shift on shift/reduce conflicts:
-            # - node_descriptions_list -> node_descriptions_list node_descriptions .
-            #  + condition -> . ! condition
-            #  + condition -> . ! and_conditions_multi_relation
-            #  + condition -> . ( condition )
-            #  + condition -> . ( and_conditions )
-            ("left", "NODEDESCS_AFTER_NODEDESCSLIST"),
-            # shift on shift/reduce conflicts:
-            # - node_descriptions -> node_descriptions or_conditions .
-            # + or_conditions -> or_conditions . OR_REL and_conditions
-            # - node_descriptions -> node_descriptions and_conditions .
-            #  + and_conditions_multi_relation -> . MULTI_RELATION { node_descriptions_list }
-            #  + condition -> . & condition
-            #  + condition -> . ( and_conditions )
-            #  + condition -> . ( condition )
-            #  + condition -> . ( or_conditions )
-            #  + condition -> . ? and_conditions_multi_relation
-            #  + condition -> . ? condition
-            #  + condition -> . [ and_conditions ]
-            #  + condition -> . [ or_conditions ]
-            #  + or_conditions -> and_conditions . OR_REL and_conditions
-            #  + relation_data -> . RELATION
-            #  + relation_data -> . RELATION NUMBER
-            #  + relation_data -> . REL_W_STR_ARG ( node_descriptions )
-            ("left", "ORCONDS_AFTER_NODEDESCS", "ANDCONDS_AFTER_NODEDESCS"),
-            ("left", "?", "&", "(", "[", "OR_REL"),
-            (
-                "left",
-                "RELATION",
-                "REL_W_STR_ARG",
-                "MULTI_RELATION",
-            ),  # REL_W_NUM_ARG don't have to be declared, as they have already been as t_RELATION
-            # shift on shift/reduce conflicts:
-            # + condition -> ( condition . )
-            # - and_conditions -> condition .
-            # + node_description -> ( node_description . )
-            # - node_descriptions -> node_description .
-            # + node_descriptions -> node_descriptions . OR_NODE node_description
-            #  - node_descriptions -> ! node_descriptions .
-            #  - node_descriptions -> @ node_descriptions .
-            # + condition -> . ! condition
-            # - node_descriptions_list -> node_descriptions .
-            ("left", "IMAGINE"),
-            ("left", ")", "!", "@"),
-            ("left", "OR_NODE"),
-            ("nonassoc", "=", "~"),
-        )
-
-        log_indent = 0
-
-        # 1. node description
-        def p_ID(p):
-            """
-            node_description : ID
-            """
-            p[0] = NodeDescription(NODE_ID, p[1])
-
-        def p_REGEX(p):
-            """
-            node_description : REGEX
-            """
-            p[0] = NodeDescription(NODE_REGEX, p[1])
-
-        def p_BLANK(p):
-            """
-            node_description : BLANK
-            """
-            p[0] = NodeDescription(NODE_ANY, p[1])
-
-        def p_ROOT(p):
-            """
-            node_description : ROOT
-            """
-            p[0] = NodeDescription(NODE_ROOT, p[1])
-
-        def p_not_node_descriptions(p):
-            """
-            node_descriptions : '!' node_descriptions
-            """
-            if not p[2].negate():
-                # Use warnings.warn instead of logging.warning to suppress repetitions
-                warnings.warn("repeated '!'", category=SyntaxWarning, stacklevel=1)
-
-            p[0] = p[2]
-
-        def p_at_node_descriptions(p):
-            """
-            node_descriptions : '@' node_descriptions
-            """
-            if not p[2].enable_basic_cat():
-                # Use warnings.warn instead of logging.warning to suppress repetitions
-                warnings.warn("repeated '@'", category=SyntaxWarning, stacklevel=1)
-
-            p[0] = p[2]
-
-        def p_node_description(p):
-            """
-            node_descriptions : node_description %prec IMAGINE
-            """
-            p[0] = NodeDescriptions(p[1])
-
-        def p_node_descriptions_or_node_node_description(p):
-            """
-            node_descriptions : node_descriptions OR_NODE node_description
-            """
-            p[1].add_description(p[3])
-
-            p[0] = p[1]
-
-        def p_lparen_node_description_rparen(p):
-            """
-            node_description : '(' node_description ')'
-            """
-            p[0] = p[2]
-
-        def p_lparen_node_descriptions_rparen(p):
-            """
-            node_descriptions : '(' node_descriptions ')'
-            """
-            p[0] = p[2]
-
-        def p_node_descriptions_equal_id(p):
-            """
-            node_descriptions : node_descriptions '=' ID
-            """
-            name: str = p[3]
-            node_descriptions: NodeDescriptions = p[1]
-            # '!' has higher precedence than '=', it will have already been
-            # reduced to node_descriptions prior to '='
-            if node_descriptions.under_negation:
-                raise ParseException("No named tregex nodes allowed in the scope of negation")
-
-            backref = BackRef(node_descriptions, None)
-            self.backref_table[name] = backref
-            node_descriptions.set_backref(backref, name)
-
-            p[0] = node_descriptions
-
-        def p_link_id(p):
-            """
-            node_descriptions : '~' ID
-            """
-            linked_name: str = p[2]
-            if linked_name not in self.backref_table:
-                raise ParseException(f"Variable {linked_name} was referenced before it was declared")
-
-            orig_nodedescs = self.backref_table[linked_name].node_descriptions
-            node_descriptions = NodeDescriptions(
-                *orig_nodedescs.descriptions,
-                under_negation=orig_nodedescs.under_negation,
-                use_basic_cat=orig_nodedescs.use_basic_cat,
+        if (shared_parser := TregexPattern._shared_parser) is None:
+            shared_parser = TregexPattern._shared_parser = yacc.yacc(
+                module=sys.modules[__name__], debug=False, start="nodes"
             )
 
-            p[0] = node_descriptions
-
-        # def p_equal_id(p):
-        #     """
-        #     node_descriptions : '=' ID
-        #     """
-        #     name = p[2]
-        #     if name not in self.backref_table:
-        #         raise ParseException(f"Variable {name} was referenced before it was declared")
-        #
-        #     backref = self.backref_table[name]
-        #     node_descriptions = NodeDescriptions(backref=backref, name=name)
-        #     p[0] = node_descriptions
-
-        # 2. relation
-        # 2.1 RELATION
-        def p_relation(p):
-            """
-            relation_data : RELATION
-            """
-            symbol = p[1]
-            p[0] = _r.RelationData(self.RELATION_MAP[symbol], symbol)
-
-        # 2.2 REL_W_STR_ARG
-        def p_rel_w_str_arg_lparen_node_descriptions_rparen(p):
-            """
-            relation_data : REL_W_STR_ARG '(' node_descriptions ')'
-            """
-            symbol = p[1]
-            p[0] = _r.RelationWithStrArgData(self.REL_W_STR_ARG_MAP[symbol], symbol, arg=p[3])
-
-        # 2.3 REL_W_NUM_ARG
-        def p_relation_number(p):
-            """
-            relation_data : RELATION NUMBER
-            """
-            rel_key, num = p[1:]
-            symbol = f"{rel_key}{num}"
-
-            if rel_key.endswith("-"):
-                num = f"-{num}"
-            p[0] = _r.RelationWithNumArgData(self.REL_W_NUM_ARG_MAP[rel_key], symbol, arg=int(num))
-
-        def p_not_condition(p):
-            """
-            condition : '!' condition
-            """
-            p[0] = Not(p[2])
-
-        def p_optional_condition(p):
-            """
-            condition : '?' condition
-            """
-            p[0] = Opt(p[2])
-
-        # 3. and_conditions
-        def p_relation_data_node_descriptions(p):
-            """
-            condition : relation_data node_descriptions %prec IMAGINE
-            """
-            # %prec IMAGINE: https://github.com/dabeaz/ply/issues/215
-            # relation_data = p[1]
-            # those_nodes, that_name = p[2].nodes, p[2].name
-
-            # p[0] = ConditionOp(
-            #     relation_data=relation_data, those_nodes=those_nodes, that_name=that_name
-            # )
-            p[0] = Condition(relation_data=p[1], node_descriptions=p[2])
-
-        def p_and_condition(p):
-            """
-            condition : '&' condition
-            """
-            p[0] = p[2]
-
-        def p_condition(p):
-            """
-            and_conditions : condition %prec IMAGINE
-            """
-            p[0] = And(p[1])
-
-        def p_and_conditions_condition(p):
-            """
-            and_conditions : and_conditions condition
-            """
-            p[1].append_condition(p[2])
-
-            p[0] = p[1]
-
-        def p_node_descriptions(p):
-            """
-            node_descriptions_list : node_descriptions %prec IMAGINE
-                                   | node_descriptions ';'
-            """
-            p[0] = [p[1]]
-
-        def p_node_descriptions_list_node_descriptions(p):
-            """
-            node_descriptions_list : node_descriptions_list node_descriptions %prec NODEDESCS_AFTER_NODEDESCSLIST
-                                   | node_descriptions_list node_descriptions ';'
-            """
-            p[1].append(p[2])
-            p[0] = p[1]
-
-        def p_multi_relation_node_descriptions_list(p):
-            """
-            and_conditions_multi_relation : MULTI_RELATION "{" node_descriptions_list "}"
-            """
-            rel_key = "<"
-            rel_op = _r.HAS_ITH_CHILD
-            node_descriptions_list = p[3]
-
-            conditions: list[AbstractCondition] = []
-            for i, node_descriptions in enumerate(node_descriptions_list, 1):
-                multi_relation_data = _r.RelationWithNumArgData(rel_op, rel_key, arg=i)
-                conditions.append(
-                    Condition(relation_data=multi_relation_data, node_descriptions=node_descriptions)
-                )
-
-            multi_relation_data = _r.RelationWithNumArgData(rel_op, rel_key, arg=i + 1)
-            node_descriptions = NodeDescriptions(NodeDescription(NODE_ANY, self.t_BLANK))
-            conditions.append(
-                Not(Condition(relation_data=multi_relation_data, node_descriptions=node_descriptions))
-            )
+        parser = copy.copy(shared_parser)
+        # grammar rules reach the pattern being parsed through p.parser.tregex
+        parser.tregex = self
+        return parser
+
+
+# ----------------------------------------------------------------------------
+#                                   Grammar
+# The rules below are collected by yacc.yacc(module=<this module>) in
+# TregexPattern.make_parser.
+
+tokens = TregexPattern.tokens
+
+precedence = (
+    # shift on shift/reduce conflicts:
+    # - node_descriptions_list -> node_descriptions_list node_descriptions .
+    #  + condition -> . ! condition
+    #  + condition -> . ! and_conditions_multi_relation
+    #  + condition -> . ( condition )
+    #  + condition -> . ( and_conditions )
+    ("left", "NODEDESCS_AFTER_NODEDESCSLIST"),
+    # shift on shift/reduce conflicts:
+    # - node_descriptions -> node_descriptions or_conditions .
+    # + or_conditions -> or_conditions . OR_REL and_conditions
+    # - node_descriptions -> node_descriptions and_conditions .
+    #  + and_conditions_multi_relation -> . MULTI_RELATION { node_descriptions_list }
+    #  + condition -> . & condition
+    #  + condition -> . ( and_conditions )
+    #  + condition -> . ( condition )
+    #  + condition -> . ( or_conditions )
+    #  + condition -> . ? and_conditions_multi_relation
+    #  + condition -> . ? condition
+    #  + condition -> . [ and_conditions ]
+    #  + condition -> . [ or_conditions ]
+    #  + or_conditions -> and_conditions . OR_REL and_conditions
+    #  + relation_data -> . RELATION
+    #  + relation_data -> . RELATION NUMBER
+    #  + relation_data -> . REL_W_STR_ARG ( node_descriptions )
+    ("left", "ORCONDS_AFTER_NODEDESCS", "ANDCONDS_AFTER_NODEDESCS"),
+    ("left", "?", "&", "(", "[", "OR_REL"),
+    (
+        "left",
+        "RELATION",
+        "REL_W_STR_ARG",
+        "MULTI_RELATION",
+    ),  # REL_W_NUM_ARG don't have to be declared, as they have already been as t_RELATION
+    # shift on shift/reduce conflicts:
+    # + condition -> ( condition . )
+    # - and_conditions -> condition .
+    # + node_description -> ( node_description . )
+    # - node_descriptions -> node_description .
+    # + node_descriptions -> node_descriptions . OR_NODE node_description
+    #  - node_descriptions -> ! node_descriptions .
+    #  - node_descriptions -> @ node_descriptions .
+    # + condition -> . ! condition
+    # - node_descriptions_list -> node_descriptions .
+    ("left", "IMAGINE"),
+    ("left", ")", "!", "@"),
+    ("left", "OR_NODE"),
+    ("nonassoc", "=", "~"),
+)
 
-            p[0] = And(*conditions)
-
-        def p_and_conditions_and_conditions_multi_relation(p):
-            """
-            and_conditions : and_conditions and_conditions_multi_relation
-            """
-            p[0] = And(p[1], p[2])
-
-        def p_and_conditions_multi_relation(p):
-            """
-            and_conditions : and_conditions_multi_relation
-            """
-            p[0] = p[1]
-
-        def p_not_and_conditions_multi_relation(p):
-            """
-            condition : '!' and_conditions_multi_relation
-            """
-            p[0] = Not(p[2])
-
-        def p_optional_and_conditions_multi_relation(p):
-            """
-            condition : '?' and_conditions_multi_relation
-            """
-            p[0] = Opt(p[2])
-
-        def p_lparen_and_condition_rparen(p):
-            """
-            condition : '(' condition ')'
-            """
-            p[0] = p[2]
-
-        def p_and_conditions_or_and_conditions(p):
-            """
-            or_conditions : and_conditions OR_REL and_conditions
-            """
-            p[0] = Or(p[1], p[3])
-
-        def p_or_conditions_or_rel_and_conditions(p):
-            """
-            or_conditions : or_conditions OR_REL and_conditions
-            """
-            p[1].append_condition(p[3])
-
-            p[0] = p[1]
-
-        def p_lparen_or_conditions_rparen(p):
-            """
-            condition : '(' or_conditions ')'
-                      | '[' or_conditions ']'
-            """
-            p[0] = p[2]
-
-        def p_not_lparen_and_conditions_rparen(p):
-            """
-            condition : '(' and_conditions ')'
-                      | '[' and_conditions ']'
-            """
-            p[0] = p[2]
-
-        def p_node_descriptions_and_conditions(p):
-            """
-            node_descriptions : node_descriptions and_conditions %prec ANDCONDS_AFTER_NODEDESCS
-            """
-            p[1].set_condition(p[2])
-            p[0] = p[1]
-
-        # def p_node_descriptions_and_conditions(p):
-        #     """
-        #     nodes : node_descriptions and_conditions
-        #     """
-        #     node_descriptions, and_conditions = p[1:]
-        #     nodes = [
-        #         node
-        #         for tree in trees
-        #         for candidate in node_descriptions.searchNodeIterator(tree)
-        #         for node in and_conditions.searchNodeIterator(candidate)
-        #     ]
-        #     p[0] = nodes
-
-        def p_node_descriptions_or_conditions(p):
-            """
-            node_descriptions : node_descriptions or_conditions %prec ORCONDS_AFTER_NODEDESCS
-            """
-            p[1].set_condition(p[2])
-            p[0] = p[1]
-
-        # def p_node_descriptions_or_conditions(p):
-        #     """
-        #     nodes : node_descriptions or_conditions
-        #     """
-        #     node_descriptions, or_conditions = p[1:]
-        #     nodes = [
-        #         node
-        #         for tree in trees
-        #         for candidate in node_descriptions.searchNodeIterator(tree)
-        #         for node in or_conditions.searchNodeIterator(candidate)
-        #     ]
-        #     p[0] = nodes
-
-        def p_node_descriptions_list(p):
-            """
-            nodes : node_descriptions_list
-            """
-            nodes = []
-            for tree in trees:
-                for node_descriptions in p[1]:
-                    nodes.extend(node_descriptions.searchNodeIterator(tree))
-            p[0] = nodes
 
-        def p_error(p) -> Never:
-            if p is None:
-                msg = "Parsing Error at EOF"
-            else:
-                msg = f"{self.lexer.lexdata}\n{' ' * p.lexpos}˄\nParsing error at token '{p.value}'"
-            raise SystemExit(msg)
+# 1. node description
+def p_ID(p):
+    """
+    node_description : ID
+    """
+    p[0] = NodeDescription(NODE_ID, p[1])
+
+
+def p_REGEX(p):
+    """
+    node_description : REGEX
+    """
+    p[0] = NodeDescription(NODE_REGEX, p[1])
+
+
+def p_BLANK(p):
+    """
+    node_description : BLANK
+    """
+    p[0] = NodeDescription(NODE_ANY, p[1])
+
+
+def p_ROOT(p):
+    """
+    node_description : ROOT
+    """
+    p[0] = NodeDescription(NODE_ROOT, p[1])
+
+
+def p_not_node_descriptions(p):
+    """
+    node_descriptions : '!' node_descriptions
+    """
+    if not p[2].negate():
+        # Use warnings.warn instead of logging.warning to suppress repetitions
+        warnings.warn("repeated '!'", category=SyntaxWarning, stacklevel=1)
+
+    p[0] = p[2]
+
+
+def p_at_node_descriptions(p):
+    """
+    node_descriptions : '@' node_descriptions
+    """
+    if not p[2].enable_basic_cat():
+        # Use warnings.warn instead of logging.warning to suppress repetitions
+        warnings.warn("repeated '@'", category=SyntaxWarning, stacklevel=1)
+
+    p[0] = p[2]
+
+
+def p_node_description(p):
+    """
+    node_descriptions : node_description %prec IMAGINE
+    """
+    p[0] = NodeDescriptions(p[1])
+
+
+def p_node_descriptions_or_node_node_description(p):
+    """
+    node_descriptions : node_descriptions OR_NODE node_description
+    """
+    p[1].add_description(p[3])
+
+    p[0] = p[1]
+
+
+def p_lparen_node_description_rparen(p):
+    """
+    node_description : '(' node_description ')'
+    """
+    p[0] = p[2]
+
+
+def p_lparen_node_descriptions_rparen(p):
+    """
+    node_descriptions : '(' node_descriptions ')'
+    """
+    p[0] = p[2]
+
+
+def p_node_descriptions_equal_id(p):
+    """
+    node_descriptions : node_descriptions '=' ID
+    """
+    name: str = p[3]
+    node_descriptions: NodeDescriptions = p[1]
+    # '!' has higher precedence than '=', it will have already been
+    # reduced to node_descriptions prior to '='
+    if node_descriptions.under_negation:
+        raise ParseException("No named tregex nodes allowed in the scope of negation")
+
+    # a name may be declared again in another branch of a disjunction, all of
+    # its declarations collect nodes into the same backref
+    backref_table = p.parser.tregex.backref_table
+    if (backref := backref_table.get(name)) is None:
+        backref = backref_table[name] = BackRef(node_descriptions, None)
+    node_descriptions.set_backref(backref, name)
+
+    p[0] = node_descriptions
+
+
+def p_link_id(p):
+    """
+    node_descriptions : '~' ID
+    """
+    linked_name: str = p[2]
+    backref_table = p.parser.tregex.backref_table
+    if linked_name not in backref_table:
+        raise ParseException(f"Variable {linked_name} was referenced before it was declared")
+
+    orig_nodedescs = backref_table[linked_name].node_descriptions
+    node_descriptions = NodeDescriptions(
+        *orig_nodedescs.descriptions,
+        under_negation=orig_nodedescs.under_negation,
+        use_basic_cat=orig_nodedescs.use_basic_cat,
+    )
+
+    p[0] = node_descriptions
+
+
+# def p_equal_id(p):
+#     """
+#     node_descriptions : '=' ID
+#     """
+#     name = p[2]
+#     if name not in self.backref_table:
+#         raise ParseException(f"Variable {name} was referenced before it was declared")
+#
+#     backref = self.backref_table[name]
+#     node_descriptions = NodeDescriptions(backref=backref, name=name)
+#     p[0] = node_descriptions
+
+
+# 2. relation
+# 2.1 RELATION
+def p_relation(p):
+    """
+    relation_data : RELATION
+    """
+    symbol = p[1]
+    p[0] = _r.RelationData(p.parser.tregex.RELATION_MAP[symbol], symbol)
+
+
+# 2.2 REL_W_STR_ARG
+def p_rel_w_str_arg_lparen_node_descriptions_rparen(p):
+    """
+    relation_data : REL_W_STR_ARG '(' node_descriptions ')'
+    """
+    symbol = p[1]
+    p[0] = _r.RelationWithStrArgData(p.parser.tregex.REL_W_STR_ARG_MAP[symbol], symbol, arg=p[3])
+
+
+# 2.3 REL_W_NUM_ARG
+def p_relation_number(p):
+    """
+    relation_data : RELATION NUMBER
+    """
+    rel_key, num = p[1:]
+    symbol = f"{rel_key}{num}"
+
+    if rel_key.endswith("-"):
+        num = f"-{num}"
+    p[0] = _r.RelationWithNumArgData(p.parser.tregex.REL_W_NUM_ARG_MAP[rel_key], symbol, arg=int(num))
+
+
+def p_not_condition(p):
+    """
+    condition : '!' condition
+    """
+    p[0] = Not(p[2])
+
+
+def p_optional_condition(p):
+    """
+    condition : '?' condition
+    """
+    p[0] = Opt(p[2])
+
+
+# 3. and_conditions
+def p_relation_data_node_descriptions(p):
+    """
+    condition : relation_data node_descriptions %prec IMAGINE
+    """
+    # %prec IMAGINE: https://github.com/dabeaz/ply/issues/215
+    # relation_data = p[1]
+    # those_nodes, that_name = p[2].nodes, p[2].name
+
+    # p[0] = ConditionOp(
+    #     relation_data=relation_data, those_nodes=those_nodes, that_name=that_name
+    # )
+    p[0] = Condition(relation_data=p[1], node_descriptions=p[2])
+
+
+def p_and_condition(p):
+    """
+    condition : '&' condition
+    """
+    p[0] = p[2]
+
+
+def p_condition(p):
+    """
+    and_conditions : condition %prec IMAGINE
+    """
+    p[0] = And(p[1])
+
+
+def p_and_conditions_condition(p):
+    """
+    and_conditions : and_conditions condition
+    """
+    p[1]._unchecked_append(p[2])
+
+    p[0] = p[1]
+
+
+def p_node_descriptions(p):
+    """
+    node_descriptions_list : node_descriptions %prec IMAGINE
+                           | node_descriptions ';'
+    """
+    p[0] = [p[1]]
+
+
+def p_node_descriptions_list_node_descriptions(p):
+    """
+    node_descriptions_list : node_descriptions_list node_descriptions %prec NODEDESCS_AFTER_NODEDESCSLIST
+                           | node_descriptions_list node_descriptions ';'
+    """
+    p[1].append(p[2])
+    p[0] = p[1]
+
+
+def p_multi_relation_node_descriptions_list(p):
+    """
+    and_conditions_multi_relation : MULTI_RELATION "{" node_descriptions_list "}"
+    """
+    rel_key = "<"
+    rel_op = _r.HAS_ITH_CHILD
+    node_descriptions_list = p[3]
+
+    conditions: list[AbstractCondition] = []
+    for i, node_descriptions in enumerate(node_descriptions_list, 1):
+        multi_relation_data = _r.RelationWithNumArgData(rel_op, rel_key, arg=i)
+        conditions.append(Condition(relation_data=multi_relation_data, node_descriptions=node_descriptions))
+
+    multi_relation_data = _r.RelationWithNumArgData(rel_op, rel_key, arg=i + 1)
+    node_descriptions = NodeDescriptions(NodeDescription(NODE_ANY, TregexPattern.t_BLANK))
+    conditions.append(Not(Condition(relation_data=multi_relation_data, node_descriptions=node_descriptions)))
+
+    p[0] = And(*conditions)
+
+
+def p_and_conditions_and_conditions_multi_relation(p):
+    """
+    and_conditions : and_conditions and_conditions_multi_relation
+    """
+    p[1]._unchecked_append(p[2])
+
+    p[0] = p[1]
+
+
+def p_and_conditions_multi_relation(p):
+    """
+    and_conditions : and_conditions_multi_relation
+    """
+    p[0] = p[1]
+
+
+def p_not_and_conditions_multi_relation(p):
+    """
+    condition : '!' and_conditions_multi_relation
+    """
+    p[0] = Not(p[2])
+
+
+def p_optional_and_conditions_multi_relation(p):
+    """
+    condition : '?' and_conditions_multi_relation
+    """
+    p[0] = Opt(p[2])
+
+
+def p_lparen_and_condition_rparen(p):
+    """
+    condition : '(' condition ')'
+    """
+    p[0] = p[2]
+
+
+def p_and_conditions_or_and_conditions(p):
+    """
+    or_conditions : and_conditions OR_REL and_conditions
+    """
+    p[0] = Or(p[1], p[3])
+
+
+def p_or_conditions_or_rel_and_conditions(p):
+    """
+    or_conditions : or_conditions OR_REL and_conditions
+    """
+    p[1]._unchecked_append(p[3])
+
+    p[0] = p[1]
+
+
+def p_lparen_or_conditions_rparen(p):
+    """
+    condition : '(' or_conditions ')'
+              | '[' or_conditions ']'
+    """
+    p[0] = p[2]
+
+
+def p_not_lparen_and_conditions_rparen(p):
+    """
+    condition : '(' and_conditions ')'
+              | '[' and_conditions ']'
+    """
+    p[0] = p[2]
+
+
+def p_node_descriptions_and_conditions(p):
+    """
+    node_descriptions : node_descriptions and_conditions %prec ANDCONDS_AFTER_NODEDESCS
+    """
+    p[1].set_condition(p[2])
+    p[0] = p[1]
+
+
+# def p_node_descriptions_and_conditions(p):
+#     """
+#     nodes : node_descriptions and_conditions
+#     """
+#     node_descriptions, and_conditions = p[1:]
+#     nodes = [
+#         node
+#         for tree in trees
+#         for candidate in node_descriptions.searchNodeIterator(tree)
+#         for node in and_conditions.searchNodeIterator(candidate)
+#     ]
+#     p[0] = nodes
+
+
+def p_node_descriptions_or_conditions(p):
+    """
+    node_descriptions : node_descriptions or_conditions %prec ORCONDS_AFTER_NODEDESCS
+    """
+    p[1].set_condition(p[2])
+    p[0] = p[1]
+
 
-        return yacc.yacc(debug=False, start="nodes")
+# def p_node_descriptions_or_conditions(p):
+#     """
+#     nodes : node_descriptions or_conditions
+#     """
+#     node_descriptions, or_conditions = p[1:]
+#     nodes = [
+#         node
+#         for tree in trees
+#         for candidate in node_descriptions.searchNodeIterator(tree)
+#         for node in or_conditions.searchNodeIterator(candidate)
+#     ]
+#     p[0] = nodes
+
+
+def p_node_descriptions_list(p):
+    """
+    nodes : node_descriptions_list
+    """
+    for node_descriptions in p[1]:
+        node_descriptions.finalize()
+    p[0] = p[1]
+
+
+def p_error(p) -> Never:
+    if p is None:
+        msg = "Parsing Error at EOF"
+    else:
+        msg = f"{p.lexer.lexdata}\n{' ' * p.lexpos}˄\nParsing error at token '{p.value}'"
+    raise SystemExit(msg)
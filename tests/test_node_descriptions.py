@@ -1,12 +1,30 @@
 #!/usr/bin/env python3
 
+import threading
+from collections.abc import Callable
+
 import pytregex.relation as _r
-from pytregex.condition import NODE_ID, NODE_REGEX, Condition, NodeDescription, NodeDescriptions
+from pytregex.condition import (
+    NODE_ANY,
+    NODE_ID,
+    NODE_REGEX,
+    NODE_ROOT,
+    Condition,
+    NodeDescription,
+    NodeDescriptions,
+    _satisfies_memo,
+    memoize_satisfies,
+)
+from pytregex.tree import Tree
 
 from .base_tmpl import BaseTmpl
 
 
 class TestNodeDescriptions(BaseTmpl):
+    def setUp(self):
+        self.tree = next(Tree.fromstring("(ROOT (NP-SBJ (DT the) (NN cat)) (VP (VBD sat) (. .)))"))
+        return super().setUp()
+
     def test_repr(self):
         desc_1 = NodeDescription(NODE_ID, "S")
         desc_2 = NodeDescription(NODE_ID, "NN")
@@ -25,3 +43,138 @@ class TestNodeDescriptions(BaseTmpl):
         node_descs1.set_condition(cond)
 
         self.assertEqual(str(node_descs1), "(!@S|NN|/V/ < S|NN)")
+
+    def test_make_checker(self):
+        def check(case, **kwargs):
+            op, value = case
+            for node in self.tree.preorder_iter():
+                self.assertEqual(op.make_checker(value, **kwargs)(node), op.satisfies(node, value, **kwargs))
+
+        self.check_under_flags(
+            ((NODE_ID, "NP"), (NODE_REGEX, "/^n/i"), (NODE_ANY, "__"), (NODE_ROOT, "_ROOT_")), check
+        )
+
+    def test_make_in_checker(self):
+        def check(case, **kwargs):
+            op, values = case
+            in_checker = op.make_in_checker(values, **kwargs)
+            checkers = [op.make_checker(value, **kwargs) for value in values]
+            for node in self.tree.preorder_iter():
+                self.assertEqual(in_checker(node), any(checker(node) for checker in checkers))
+
+        self.check_under_flags(
+            (
+                (NODE_ID, ("NP", "VP", "DT")),
+                (NODE_ID, ("NP", "NP")),
+                (NODE_REGEX, ("/^n/i", "/^V/", "/(.)\\1/")),
+                (NODE_REGEX, ("/^n/i", "/^V/")),
+            ),
+            check,
+        )
+
+    def test_make_value_test(self):
+        for op, values in (
+            (NODE_ID, ("NP-SBJ", "VP", "DT")),
+            (NODE_REGEX, ("/^n/i",)),
+            (NODE_REGEX, ("/^n/i", "/^V/")),
+            (NODE_REGEX, ("/^n/i", "/^V/", "/(.)\\1/")),
+        ):
+            with self.subTest(op=op, values=values):
+                test = op.make_value_test(values)
+                if test is None:
+                    # capturing groups are not fused
+                    self.assertEqual(values[-1], "/(.)\\1/")
+                    continue
+                for node in self.tree.preorder_iter():
+                    if node.label is not None:
+                        self.assertEqual(test(node.label) is not None, op.in_(node, values))
+        self.assertIsNone(NODE_ANY.make_value_test(("__",)))
+
+    def test_in(self):
+        def check(case, **kwargs):
+            op, values = case
+            for node in self.tree.preorder_iter():
+                self.assertEqual(
+                    op.in_(node, values, **kwargs), any(op.satisfies(node, value, **kwargs) for value in values)
+                )
+
+        self.check_under_flags(
+            ((NODE_ID, ("NP", "VP", "DT")), (NODE_REGEX, ("/^n/i", "/^V/", "/(.)\\1/"))), check
+        )
+
+    def test_satisfies_ids_and_regexes(self):
+        def check(descs, **kwargs):
+            node_descs = NodeDescriptions(*descs, **kwargs)
+            for node in self.tree.preorder_iter():
+                self.assertEqual(
+                    node_descs.satisfies(node),
+                    any(desc.op.satisfies(node, desc.value, **kwargs) for desc in descs),
+                )
+
+        self.check_under_flags(
+            (
+                (
+                    NodeDescription(NODE_ID, "DT"),
+                    NodeDescription(NODE_REGEX, "/^n/i"),
+                    NodeDescription(NODE_ID, "."),
+                    NodeDescription(NODE_REGEX, "/^V/"),
+                ),
+            ),
+            check,
+        )
+
+    def test_search_node_iterator(self):
+        def check(descs, **kwargs):
+            node_descs = NodeDescriptions(*descs, **kwargs)
+            self.assertEqual(
+                list(node_descs.searchNodeIterator(self.tree)),
+                list(filter(node_descs.satisfies, self.tree.preorder_iter())),
+            )
+
+        self.check_under_flags(
+            (
+                (NodeDescription(NODE_ID, "NN"),),
+                (NodeDescription(NODE_ID, "DT"), NodeDescription(NODE_ID, ".")),
+                (NodeDescription(NODE_REGEX, "/^n/i"),),
+                (NodeDescription(NODE_REGEX, "/^$/"),),
+                (NodeDescription(NODE_ID, "DT"), NodeDescription(NODE_REGEX, "/^V/")),
+                (NodeDescription(NODE_ANY, "__"),),
+            ),
+            check,
+        )
+
+    def test_memoize_satisfies_per_thread(self):
+        tree = next(Tree.fromstring("(ROOT (NP (NN cat)))"))
+        np = tree.children[0]
+        cond = Condition(_r.RelationData(_r.DOMINATES, "<<"), NodeDescriptions(NodeDescription(NODE_ID, "NN")))
+
+        seen_in_thread = []
+
+        def check_in_thread():
+            seen_in_thread.append(_satisfies_memo.get())
+            seen_in_thread.append(cond.satisfies(np))
+
+        with memoize_satisfies():
+            memo = _satisfies_memo.get()
+            self.assertTrue(cond.satisfies(np))
+            self.assertEqual(len(memo), 1)
+            thread = threading.Thread(target=check_in_thread)
+            thread.start()
+            thread.join()
+            # the other thread neither sees nor fills this thread's memo
+            self.assertEqual(seen_in_thread, [None, True])
+            self.assertFalse(cond.satisfies(np.children[0]))
+            self.assertEqual(len(memo), 2)
+        self.assertIsNone(_satisfies_memo.get())
+
+    def check_under_flags(self, cases, check: Callable[..., None]):
+        """
+        Call `check(case, under_negation=..., use_basic_cat=...)` for each case
+        under each combination of the flags, as a subTest of its own.
+        """
+        for case in cases:
+            for under_negation in (False, True):
+                for use_basic_cat in (False, True):
+                    kwargs = {"under_negation": under_negation, "use_basic_cat": use_basic_cat}
+                    with self.subTest(case=case, **kwargs):
+                        check(case, **kwargs)
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
 import re
+import sys
 
-from pytregex.tree import Tree
+from pytregex.tree import Tree, cache_preorder
 
 from .base_tmpl import BaseTmpl
 from .base_tmpl import tree as tree_string
@@ -44,6 +45,11 @@ class TestTree(BaseTmpl):
         new_label = "TOOR"  # inverse of ROOT
         tree.set_label(new_label)
         self.assertEqual(tree.label, new_label)
+        # a label built at runtime is a new string object, which set_label
+        # swaps for the interned one
+        prefix = "TO"
+        tree.set_label(prefix + "OR")
+        self.assertIs(tree.label, sys.intern(new_label))
 
         self.assertRaises(TypeError, tree.set_label, [new_label])
 
@@ -139,6 +145,48 @@ class TestTree(BaseTmpl):
         tree_string = re.sub(r"\n\s+", " ", self.tree_string.strip())
         self.assertEqual(tree.tostring(), tree_string)
 
+    def test_preorder_list(self):
+        expected = list(self.tree.preorder_iter())
+        self.assertEqual(self.tree.preorder_list(), expected)
+        self.assertIsNot(self.tree.preorder_list(), self.tree.preorder_list())
+        with cache_preorder():
+            nodes = self.tree.preorder_list()
+            self.assertEqual(nodes, expected)
+            self.assertIs(self.tree.preorder_list(), nodes)
+            # preorder_iter walks the tree as it is, cache or not
+            leaf = self.tree.getLeaves()[-1]
+            leaf.children.append(Tree("appended"))
+            self.assertEqual(list(self.tree.preorder_iter()), [*expected, leaf.children[0]])
+            leaf.children.clear()
+
+        # the cache is dropped on leaving the block, so that edits made by
+        # any means are seen afterwards
+        leaf = self.tree.getLeaves()[0]
+        leaf.children.append(Tree("new", parent=leaf))
+        expected.insert(expected.index(leaf) + 1, leaf.children[0])
+        self.assertEqual(self.tree.preorder_list(), expected)
+        self.assertRaises(ValueError, Tree().preorder_list)
+
+    def test_preorder_collect(self):
+        pred = lambda node: node.label is not None and node.label.startswith("N")  # noqa: E731
+        self.assertEqual(self.tree.preorder_collect(pred), list(filter(pred, self.tree.preorder_iter())))
+        self.assertEqual(self.tree.preorder_collect(lambda node: True), list(self.tree.preorder_iter()))
+        self.assertRaises(ValueError, Tree().preorder_collect, pred)
+
+    def test_preorder_labels(self):
+        labels = self.tree.preorder_labels()
+        self.assertEqual(labels, [node.label or "" for node in self.tree.preorder_list()])
+        with cache_preorder():
+            labels = self.tree.preorder_labels()
+            self.assertIs(self.tree.preorder_labels(), labels)
+
+        leaf = self.tree.getLeaves()[0]
+        leaf.label = None
+        labels = self.tree.preorder_labels()
+        self.assertEqual(labels[self.tree.preorder_list().index(leaf)], "")
+        leaf.children.append(Tree("new"))
+        self.assertIn("new", self.tree.preorder_labels())
+
     def test_root(self):
         child = self.tree[0]
         grandchild = self.tree[0, 0]
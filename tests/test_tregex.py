@@ -6,7 +6,7 @@
 from typing import Union
 
 from pytregex.exceptions import ParseException
-from pytregex.tree import Tree
+from pytregex.tree import Tree, cache_preorder
 from pytregex.tregex import TregexPattern
 
 from .base_tmpl import BaseTmpl
@@ -1575,6 +1575,88 @@ class TestTregex(BaseTmpl):
         self.run_test(r"/\(/ < B", "(A (-LRB- B))", "(-LRB- B)")
         self.run_test(r"/\)/ < B", "(A (-RRB- B))", "(-RRB- B)")
 
+    def test_conjuncts_printed_alike(self):
+        # `<1 A` and the 11th child of `<...` both print as `<11 A`, but are
+        # not the same condition
+        tree_str = "(X (B x) (C x) (D x) (E x) (F x) (G x) (H x) (I x) (J x) (K x) (A x))"
+        multi_relation = "<... { B ; C ; D ; E ; F ; G ; H ; I ; J ; K ; A }"
+        self.run_test(f"X {multi_relation} <1 A", tree_str)
+        self.run_test(f"X <1 A {multi_relation}", tree_str)
+        self.run_test(f"X {multi_relation} <1 B", tree_str, tree_str)
+
+    def test_findall_twice(self):
+        # the pattern is parsed once and reused, with the named nodes of the
+        # previous findall forgotten
+        pattern = TregexPattern("NP < NN=a")
+        self.assertIs(pattern.compile(), pattern.compile())
+        self.assertEqual(len(pattern.findall("(NP (NN a) (NN b))")), 2)
+        self.assertEqual(len(pattern.findall("(S (NP (NN c)) (VP (NN d)))")), 1)
+        self.assertEqual([node.tostring() for node in pattern.get_nodes("a")], ["(NN c)"])
+
+    def test_search_after_editing_tree(self):
+        # nothing cached by a search outlives it, so a tree edited directly
+        # afterwards is searched as it is then
+        node_descriptions = TregexPattern("NN").compile()[0]
+        tree = next(Tree.fromstring("(S (NP (DT a)))"))
+        with cache_preorder():
+            self.assertEqual(list(node_descriptions.searchNodeIterator(tree)), [])
+        np = tree.children[0]
+        nn = Tree("NN", [Tree("cat")])
+        np.children.append(nn)
+        nn.parent = np
+        with cache_preorder():
+            self.assertEqual(list(node_descriptions.searchNodeIterator(tree)), [nn])
+
+    def test_negated_name_checked_again(self):
+        # the negated condition is checked on A once per C child, and names E
+        # each time
+        pattern = TregexPattern("A < C & !< E=e")
+        self.assertEqual(pattern.findall("(A (C c) (C d) (E (F f)))"), [])
+        self.assertEqual([node.tostring() for node in pattern.get_nodes("e")], ["(E (F f))"] * 2)
+
+    def test_compile_after_failure(self):
+        # a parse that failed halfway leaves nothing behind for the next one
+        # to link names to
+        pattern = TregexPattern("A=a < B=a")
+        self.assertRaises(ParseException, pattern.compile)
+        backref = pattern.backref_table["a"]
+        self.assertRaises(ParseException, pattern.compile)
+        self.assertIsNot(pattern.backref_table["a"], backref)
+
+    def test_memoized_search(self):
+        # findall memoizes condition results and match counts, which must not
+        # change the matches of searching without it
+        tree_str = "(S (NP (NN a) (NN b) (DT c)) (VP (VB d) (NP (DT e) (NN f))))"
+        for pattern in (
+            "NP << NN << DT",
+            "NP < NN < NN !<< VB",
+            "__ << NN=a << DT",
+            "S << (NP << NN) << (NP << DT)",
+            "NP [<< VB || << DT] !<< VB",
+            "__ < __ < __ < __",
+        ):
+            with self.subTest(pattern=pattern):
+                tregex = TregexPattern(pattern)
+                tree = next(Tree.fromstring(tree_str))
+                expected = [m.tostring() for descs in tregex.compile() for m in descs.searchNodeIterator(tree)]
+                self.assertEqual([m.tostring() for m in tregex.findall(tree_str)], expected)
+
+    def test_repeated_conjuncts(self):
+        # a repeated condition is searched once but still counts once per
+        # occurrence: each NN child pairs with each NN child
+        self.run_test("NP < NN < NN", "(NP (NN a) (NN b))", *["(NP (NN a) (NN b))"] * 4)
+        tree_str = "(S (NP (NN a) (NN b) (DT c)) (NP (NN d)))"
+        self.run_test("NP < NN < NN < DT", tree_str, *["(NP (NN a) (NN b) (DT c))"] * 4)
+        self.run_test("NP < NN < NN", tree_str, *["(NP (NN a) (NN b) (DT c))"] * 4, "(NP (NN d))")
+
+    def test_many_trees(self):
+        # trees without matches are freed while findall goes on, so node ids
+        # get reused; results must not leak from one tree to another
+        tree_str = " ".join(["(ROOT (A (B x))) (ROOT (A (C x)))"] * 3000)
+        for pattern in ("A !< B", "A !<< B", "A << C"):
+            with self.subTest(pattern=pattern):
+                self.assertEqual(len(TregexPattern(pattern).findall(tree_str)), 3000)
+
     def run_test(self, pattern: Union[TregexPattern, str], tree_str: str, *expected_results: str):
         """
         Check that running the Tregex pattern on the tree gives the results